@@ -77,20 +77,19 @@
 
 import os
 import sys
+import io
 import re
-import copy
 import json
 import math
+import functools
+import mmap
 from tqdm import tqdm
 import warnings
 import traceback
 
-# import threading
+import threading
 # import multiprocessing as mp
 # mp.set_start_method('spawn')
-# try:
-#    import Queue as queue
-# except: import queue as queue
         
 import numpy as np
 # from scipy.spatial import ConvexHull
@@ -98,10 +97,10 @@ import numpy as np
 
 import pyproj
 import utm
-import laspy as lp
 from osgeo import gdal
 from osgeo import ogr
-import h5py as h5
+## laspy, h5py, vrbag (h5py, scipy) and cshelph are only needed by their
+## dataset modules and are imported there, on first use.
 
 import cudem
 from cudem import utils
@@ -112,11 +111,15 @@ from cudem import factory
 from cudem import vdatums
 from cudem import fetches
 from cudem import grits
-from cudem import vrbag
 
-# cshelph
 import pandas as pd
-from cudem import cshelph
+
+## orjson parses/serializes json in C, use it for inf files if available
+try:
+    import orjson
+    has_orjson = True
+except ImportError:
+    has_orjson = False
 
 ## Config info and setup
 gc = utils.config_check()
@@ -124,8 +127,76 @@ gdal.DontUseExceptions()
 ogr.DontUseExceptions()
 gdal.SetConfigOption('CPL_LOG', 'NUL' if gc['platform'] == 'win32' else '/dev/null') 
 
+## laspy is imported on first use by the LAS dataset module, see `_laspy`
+_lp = None
+def _laspy():
+    """import laspy once, on first use, and return the module"""
+
+    global _lp
+    if _lp is None:
+        import laspy
+        _lp = laspy
+
+    return(_lp)
+
+def _remove_remote_fns(remote_fns):
+    """remove the fetched remote files `remote_fns`, and their sidecar files"""
+    
+    ## list each directory once, rather than globbing it for every remote file
+    remote_dirs = {}
+    for remote_fn in remote_fns:
+        remote_dirs.setdefault(
+            os.path.dirname(os.path.abspath(remote_fn)), []
+        ).append(os.path.basename(remote_fn))
+
+    for remote_dir, remote_names in remote_dirs.items():
+        remote_names = tuple(remote_names)
+        try:
+            with os.scandir(remote_dir) as remote_entries:
+                remote_paths = [x.path for x in remote_entries if x.name.startswith(remote_names)]
+        except OSError:
+            continue
+
+        for remote_path in remote_paths:
+            if os.path.isdir(remote_path):
+                utils.remove_glob(remote_path)
+            else:
+                try:
+                    os.unlink(remote_path)
+                except OSError:
+                    pass
+
+## datalists usually hold many datasets sharing the same src/dst srs pair,
+## parse the crs' and build the transformers once per pair.
+@functools.lru_cache(maxsize=64)
+def _crs_from_user_input(srs):
+    return(pyproj.CRS.from_user_input(srs))
+
+@functools.lru_cache(maxsize=64)
+def _transformer_from_crs(in_crs, out_crs, aoi_bounds=None):
+    aoi = pyproj.aoi.AreaOfInterest(*aoi_bounds) if aoi_bounds is not None else None
+    return(pyproj.Transformer.from_crs(in_crs, out_crs, always_xy=True, area_of_interest=aoi))
+
+## the datasets of a datalist share the region, so transform it once per srs pair;
+## copy the returned region before modifying it.
+@functools.lru_cache(maxsize=64)
+def _trans_region(region_list, in_proj4, in_crs, out_crs):
+    trans_region = regions.Region(src_srs=in_proj4).from_list(list(region_list))
+    trans_region.wkt = None
+    trans_region.transform(_transformer_from_crs(out_crs, in_crs))
+    return(trans_region)
+
 ## Datalist convenience functions
 ## data_list is a list of dlim supported datasets
+
+## an empty field in a comma-separated entry, i.e. between two commas or a comma and the
+## start/end of the entry
+_empty_entry_field = re.compile(r'(?<![^,])(?![^,])')
+def _datalist_entry(dl):
+    """convert a comma-separated entry to a datalist entry, filling empty fields with '-'"""
+
+    return(_empty_entry_field.sub('-', dl).replace(',', ' '))
+
 def make_datalist(data_list, want_weight, want_uncertainty, region,
                   src_srs, dst_srs, x_inc, y_inc, sample_alg,
                   verbose):
@@ -149,7 +220,7 @@ def make_datalist(data_list, want_weight, want_uncertainty, region,
 
     ## add the datasets from data_list to the datalist object
     xdl.data_entries = [DatasetFactory(
-        fn=" ".join(['-' if x == "" else x for x in dl.split(",")]),
+        fn=_datalist_entry(dl),
         weight=None if not want_weight else 1,
         uncertainty=None if not want_uncertainty else 0,
         src_region=region,
@@ -160,7 +231,7 @@ def make_datalist(data_list, want_weight, want_uncertainty, region,
         y_inc=y_inc,
         sample_alg=sample_alg,
         parent=xdl,
-        cache_dir=self.cache_dir
+        cache_dir=xdl.cache_dir
     )._acquire_module() for dl in data_list]
     return(xdl)
 
@@ -204,7 +275,7 @@ def init_data(data_list,
 
     try:
         xdls = [DatasetFactory(
-            mod=" ".join(['-' if x == "" else x for x in dl.split(",")]),
+            mod=_datalist_entry(dl),
             data_format = None,
             weight=None if not want_weight else 1,
             uncertainty=None if not want_uncertainty else 0,
@@ -427,8 +498,7 @@ class BinZ(PointFilter):
                 ys, xs, zs = self.get_bin_height(binned_points)
                 binned_points = None
                 
-                bin_ds = np.column_stack((xs, ys, zs))
-                bin_ds = np.rec.fromrecords(bin_ds, names='x, y, z')
+                bin_ds = np.rec.fromarrays([xs, ys, zs], names='x, y, z', formats=['f8'] * 3)
                 
                 xs = ys = zs = None
                 bin_ds = bin_ds[~np.isnan(bin_ds['z'])]
@@ -440,9 +510,8 @@ class BinZ(PointFilter):
                     "EPSG:"+str(epsg_num), "EPSG:4326", always_xy=True
                 )
                 lon_wgs84, lat_wgs84 = transformer.transform(bin_ds['x'], bin_ds['y'])
-                bin_points = np.column_stack((lon_wgs84, lat_wgs84, bin_ds['z']))
+                bin_points = np.rec.fromarrays([lon_wgs84, lat_wgs84, bin_ds['z']], names='x,y,z')
                 lon_wgs84 = lat_wgs84 = bin_ds = None
-                bin_points = np.rec.fromrecords(bin_points, names='x,y,z')
                 #utils.echo_msg('bin_points: {}'.format(bin_points))
                 return(bin_points)
             # return(bin_ds)
@@ -467,10 +536,12 @@ class INF:
                  minmax = [],
                  wkt = None,
                  fmt = None,
-                 src_srs = None):
+                 src_srs = None,
+                 stat_sig = None):
         self.name = name
         self.file_hash = file_hash
         self.hash = file_hash
+        self.stat_sig = stat_sig
         self.numpts = numpts
         self.minmax = minmax
         self.wkt = wkt
@@ -489,20 +560,24 @@ class INF:
 
         import hashlib
         fn = self.name if fn is None else fn
-        BUF_SIZE = 65536
-        if sha1:
-            this_hash = hashlib.sha1()
-        else:
-            this_hash = hashlib.md5()
-            
+        BUF_SIZE = 1048576
+        hash_name = 'sha1' if sha1 else 'md5'
         try:
             with open(fn, 'rb') as f:
-                while True:
-                    data = f.read(BUF_SIZE)
-                    if not data:
-                        break
+                ## file_digest (py3.11+) hashes the file in C without
+                ## copying each chunk into a python bytes object
+                if hasattr(hashlib, 'file_digest'):
+                    this_hash = hashlib.file_digest(f, hash_name)
+                else:
+                    this_hash = hashlib.new(hash_name)
+                    buf = bytearray(BUF_SIZE)
+                    view = memoryview(buf)
+                    while True:
+                        n = f.readinto(buf)
+                        if not n:
+                            break
 
-                    this_hash.update(data)
+                        this_hash.update(view[:n])
 
             self.file_hash = this_hash.hexdigest()
         
@@ -510,6 +585,16 @@ class INF:
             self.file_hash = '0'
 
         return(self.file_hash)
+
+    def generate_stat_sig(self, fn = None):
+        """generate a cheap signature ([size, mtime_ns]) of the xyz-dataset source file"""
+
+        fn = self.name if fn is None else fn
+        try:
+            fn_stat = os.stat(fn)
+            return([fn_stat.st_size, fn_stat.st_mtime_ns])
+        except:
+            return(None)
         
     def generate(self):
         if self.name is None:
@@ -527,8 +612,10 @@ class INF:
         
         if os.path.exists(inf_fn):
             try:
-                with open(inf_fn, 'r') as inf_ob:
-                    data = json.load(inf_ob)
+                with open(inf_fn, 'rb') as inf_ob:
+                    inf_data = inf_ob.read()
+                    
+                data = orjson.loads(inf_data) if has_orjson else json.loads(inf_data)
             except ValueError:
                 try:
                     data = MBSParser(fn=inf_fn).inf_parse().infos.__dict__
@@ -551,11 +638,25 @@ class INF:
         if inf_fn is None:
             if self.name is not None:
                 inf_fn = '{}.inf'.format(self.name)
+        if inf_fn is None:
+            return
+        
+        ## write to a temporary file and rename it over the inf file, so
+        ## concurrent readers/writers never see a partially written inf
+        tmp_inf_fn = '{}.tmp.{}.{}'.format(inf_fn, os.getpid(), threading.get_ident())
         try:
-            with open(inf_fn, 'w') as outfile:
-                json.dump(self.__dict__, outfile)
+            if has_orjson:
+                inf_data = orjson.dumps(self.__dict__, option=orjson.OPT_SERIALIZE_NUMPY)
+            else:
+                inf_data = json.dumps(self.__dict__).encode('utf-8')
+                
+            with open(tmp_inf_fn, 'wb') as outfile:
+                outfile.write(inf_data)
+
+            os.replace(tmp_inf_fn, inf_fn)
         except:
-            pass
+            if os.path.exists(tmp_inf_fn):
+                os.remove(tmp_inf_fn)
         
 class ElevationDataset:
     """representing an Elevation Dataset
@@ -617,6 +718,11 @@ class ElevationDataset:
         'min', 'max', 'mean', 'supercede'
     ]
 
+    ## stacks up to this size (bytes) are accumulated in memory, see `_stacks`
+    stack_max_memory = 2 * 1024 ** 3
+
+    _http_sessions = threading.local() # per-thread requests.Session, see `http_session`
+
     ## todo: add transformation grid option (stacks += transformation_grid), geoids
     def __init__(self,
                  fn = None,
@@ -644,10 +750,8 @@ class ElevationDataset:
                  verbose = False,
                  remote = False,
                  dump_precision = 6,
-                 params = {},
-                 metadata = {'name':None, 'title':None, 'source':None, 'date':None,
-                             'data_type':None, 'resolution':None, 'hdatum':None,
-                             'vdatum':None, 'url':None}, **kwargs):
+                 params = None,
+                 metadata = None, **kwargs):
         self.fn = fn # dataset filename or fetches module
         self.data_format = data_format # dataset format
         self.weight = weight # dataset weight
@@ -664,7 +768,9 @@ class ElevationDataset:
         self.want_mask = want_mask # mask the data
         self.want_sm = want_sm # generate spatial metadata vector
         self.sample_alg = sample_alg # the gdal resample algorithm
-        self.metadata = copy.deepcopy(metadata) # dataset metadata
+        ## metadata values are flat strings/None, so a shallow copy is sufficient
+        self.metadata = dict(metadata) if metadata is not None \
+            else dict.fromkeys(DatasetFactory._metadata_keys) # dataset metadata
         self.parent = parent # dataset parent obj
         self.region = src_region # ROI
         self.invert_region = invert_region # invert the region
@@ -675,6 +781,8 @@ class ElevationDataset:
         self.stack_node = stack_node # yield avg x/y data instead of center
         self.stack_mode = stack_mode # 'mean', 'min', 'max', 'supercede'
         self.mask_keys = ['mask', 'invert_mask', 'ogr_or_gdal'] # options for input data mask
+        self._fn_stat = None # cached (fn, valid) result of the `self.fn` stat check
+        self._inf_region = None # cached (inf-extent, region) built from `self.infos`
         if self.mask is not None:
             if isinstance(self.mask, str):
                 self.mask = {'mask': self.mask}
@@ -693,7 +801,8 @@ class ElevationDataset:
                     self.mask[key] = None
             
         self.infos = INF(name=self.fn, file_hash='0', numpts=0, fmt=self.data_format) # infos blob            
-        self.params = params # the factory parameters
+        ## a fresh dict, a shared default would carry the first dataset's params into the rest
+        self.params = params if params is not None else {} # the factory parameters
         if not self.params:
             self.params['kwargs'] = self.__dict__.copy()
             self.params['mod'] = self.fn
@@ -725,7 +834,7 @@ class ElevationDataset:
             'pnt_fltrs': self.pnt_fltrs,
             'cache_dir': self.cache_dir,
             'verbose': self.verbose,
-            'metadata': copy.deepcopy(self.metadata)
+            'metadata': dict(self.metadata)
         }
         for kw in kwargs.keys():
             _params[kw] = kwargs[kw]
@@ -752,6 +861,7 @@ class ElevationDataset:
         self.data_region = None # self.region and inf.region reduced
         self.archive_datalist = None # the datalist of the archived data
         self.data_entries = [] # 
+        self._sindex = None # (datalist mtime, entry line numbers, entry xy bounds) of the parsed datalist entries
         self.data_lists = {} #
         self.cache_dir = utils.cudem_cache() if self.cache_dir is None else self.cache_dir # cache directory
         if self.sample_alg not in self.gdal_sample_methods: # gdal_warp resmaple algorithm 
@@ -827,31 +937,18 @@ class ElevationDataset:
             
         this_region = regions.Region()
         point_count = 0
-
         for points in self.yield_points():
+            ## one min/max pass per field, per chunk
+            chunk_minmax = [f(points[key]) for key in ['x', 'y', 'z'] for f in [np.min, np.max]]
             if point_count == 0:
-                this_region.from_list(
-                    [
-                        points['x'].min(), points['x'].max(),
-                        points['y'].min(), points['y'].max(),
-                        points['z'].min(), points['z'].max()
-                    ]
-                )
+                this_region.from_list(chunk_minmax)
             else:
-                if points['x'].min() < this_region.xmin:
-                    this_region.xmin = points['x'].min()
-                elif points['x'].max() > this_region.xmax:
-                    this_region.xmax = points['x'].max()
-                    
-                if points['y'].min() < this_region.ymin:
-                    this_region.ymin = points['y'].min()
-                elif points['y'].max() > this_region.ymax:
-                    this_region.ymax = points['y'].max()
-                    
-                if points['z'].min() < this_region.zmin:
-                    this_region.zmin = points['z'].min()
-                elif points['z'].min() > this_region.zmax:
-                    this_region.zmax = points['z'].min()
+                this_region.xmin = min(this_region.xmin, chunk_minmax[0])
+                this_region.xmax = max(this_region.xmax, chunk_minmax[1])
+                this_region.ymin = min(this_region.ymin, chunk_minmax[2])
+                this_region.ymax = max(this_region.ymax, chunk_minmax[3])
+                this_region.zmin = min(this_region.zmin, chunk_minmax[4])
+                this_region.zmax = max(this_region.zmax, chunk_minmax[5])
                 
             point_count += len(points)
 
@@ -880,20 +977,29 @@ class ElevationDataset:
                 yield(points)
         
     def yield_xyz_from_entries(self):
-        """yield from self.data_entries, list of datasets"""
-        
-        for this_entry in self.data_entries:
-            for xyz in this_entry.xyz_yield:
-                yield(xyz)
-                
-            if this_entry.remote:
-                utils.remove_glob('{}*'.format(this_entry.fn))
+        """yield from the datasets found by `yield_entries`
+
+        fetched remote files are removed once the entries are exhausted,
+        or the generator is closed.
+        """
+
+        remote_fns = set()
+        try:
+            for this_entry in self.yield_entries():
+                for xyz in this_entry.xyz_yield:
+                    yield(xyz)
+
+                if this_entry.remote:
+                    remote_fns.add(this_entry.fn)
+        finally:
+            _remove_remote_fns(remote_fns)
 
     def yield_entries(self):
         """yield from self.data_entries, list of datasets"""
         
         for this_entry in self.data_entries:
-            yield(this_entry)
+            if this_entry is not None:
+                yield(this_entry)
 
     def set_yield(self):
         """set the yield strategy, either default (all points) or mask or stacks
@@ -955,16 +1061,20 @@ class ElevationDataset:
             if mask_band is not None:
                 ycount, xcount = out_arrays['z'].shape
                 this_region = regions.Region().from_geo_transform(this_gt, xcount, ycount)
+                ## build the mask's nodata test once, in the mask's own dtype,
+                ## rather than casting it to float and re-testing it for each array
                 mask_data = mask_band.ReadAsArray(*this_srcwin)
-                if not np.isnan(mask_infos['ndv']):
-                    mask_data[mask_data==mask_infos['ndv']] = np.nan
-                        
+                mask_ndv = utils.float_or(mask_infos['ndv'])
+                mask_nd = np.isnan(mask_data)
+                if mask_ndv is not None and not np.isnan(mask_ndv):
+                    mask_nd |= mask_data == mask_ndv
+
+                if self.mask['invert_mask']:
+                    mask_nd = ~mask_nd
+                    
                 for arr in out_arrays.keys():
                     if out_arrays[arr] is not None:
-                        if self.mask['invert_mask']:
-                            out_arrays[arr][~np.isnan(mask_data)] = np.nan
-                        else:
-                            out_arrays[arr][np.isnan(mask_data)] = np.nan
+                        out_arrays[arr][mask_nd] = np.nan
 
             yield(out_arrays, this_srcwin, this_gt)
 
@@ -984,21 +1094,31 @@ class ElevationDataset:
                     src_ds = gdal.Open(this_entry.mask['mask'])
                     if src_ds is not None:
                         ds_config = gdalfun.gdal_infos(src_ds)
-                        ds_band = src_ds.GetRasterBand(1)
                         ds_gt = ds_config['geoT']
                         ds_nd = ds_config['ndv']
-                    
-                        for this_xyz in this_entry.yield_xyz():
-                            xpos, ypos = utils._geo2pixel(this_xyz.x, this_xyz.y, ds_gt, node='pixel')
-                            if xpos < ds_config['nx'] and ypos < ds_config['ny'] and xpos >=0 and ypos >=0:
-                                tgrid = ds_band.ReadAsArray(xpos, ypos, 1, 1)
-                                if tgrid is not None:
-                                    if tgrid[0][0] == ds_nd:
-                                        if this_entry.mask['invert_mask']:
-                                            yield(this_xyz)
-                                    else:
-                                        if not this_entry.mask['invert_mask']:
-                                            yield(this_xyz)                                            
+                        ds_band = src_ds.GetRasterBand(1)
+                        
+                        ## look up the mask value of each batch of points at once,
+                        ## points outside of the mask raster are dropped
+                        for points_x, points_y, points_z, points_w, points_u in this_entry.yield_xyz_batch():
+                            xpos = np.floor((points_x - ds_gt[0]) / ds_gt[1]).astype(np.int64)
+                            ypos = np.floor((points_y - ds_gt[3]) / ds_gt[5]).astype(np.int64)
+                            in_mask = (xpos >= 0) & (xpos < ds_config['nx']) & (ypos >= 0) & (ypos < ds_config['ny'])
+                            mask_vals = gdalfun.gdal_read_pixels(ds_band, xpos[in_mask], ypos[in_mask])
+                            if ds_nd is not None and np.isnan(ds_nd):
+                                mask_nd = np.isnan(mask_vals)
+                            else:
+                                mask_nd = mask_vals == ds_nd
+
+                            keep = mask_nd if this_entry.mask['invert_mask'] else ~mask_nd
+                            keep_idx = np.flatnonzero(in_mask)[keep]
+                            for x, y, z, w, u in zip(
+                                    points_x[keep_idx], points_y[keep_idx], points_z[keep_idx],
+                                    points_w[keep_idx], points_u[keep_idx]
+                            ):
+                                yield(xyzfun.XYZPoint(x=x, y=y, z=z, w=w, u=u))
+
+                        src_ds = ds_band = None
                 else:
                     ## this is very slow! find another way.
                     src_ds = ogr.Open(this_entry.mask['mask'])
@@ -1019,54 +1139,148 @@ class ElevationDataset:
                             if not this_entry.mask['invert_mask']:
                                 yield(this_xyz)
             
-    def dump_xyz(self, dst_port=sys.stdout, encode=False):
+    def dump_xyz(self, dst_port=sys.stdout, encode=False, batch_size=65536,
+                 include_w=None, include_u=None, precision=None):
         """dump the XYZ data from the dataset.
 
         data gets parsed through `self.xyz_yield`. See `set_yield` for more info.
+
+        points are formatted as in `XYZPoint.dump` and written to `dst_port`
+        in batches of `batch_size` lines, rather than one write per point.
+
+        include_w/include_u default to whether the dataset has a weight/uncertainty
+        and precision defaults to `self.dump_precision`.
         """
 
+        if include_w is None:
+            include_w = True if self.weight is not None else False
+
+        if include_u is None:
+            include_u = True if self.uncertainty is not None else False
+
+        if precision is None:
+            precision = self.dump_precision
+            
+        line_fmt = ' '.join(
+            ['{:.8f}', '{:.8f}'] + ['{{:.{}f}}'.format(precision)] * (1 + include_w + include_u)
+        ) + '\n'
+        if include_w and include_u:
+            format_xyz = lambda p: line_fmt.format(p.x, p.y, p.z, p.w, p.u)
+        elif include_w:
+            format_xyz = lambda p: line_fmt.format(p.x, p.y, p.z, p.w)
+        elif include_u:
+            format_xyz = lambda p: line_fmt.format(p.x, p.y, p.z, p.u)
+        else:
+            format_xyz = lambda p: line_fmt.format(p.x, p.y, p.z)
+
+        def write_lines(xyz_lines):
+            out_buf = ''.join(xyz_lines)
+            dst_port.write(out_buf.encode('utf-8') if encode else out_buf)
+            
+        xyz_lines = []
         for this_xyz in self.xyz_yield:
-            this_xyz.dump(
-                include_w=True if self.weight is not None else False,
-                include_u=True if self.uncertainty is not None else False,
-                dst_port=dst_port,
-                encode=encode,
-                precision=self.dump_precision
-            )
+            xyz_lines.append(format_xyz(this_xyz))
+            if len(xyz_lines) >= batch_size:
+                write_lines(xyz_lines)
+                xyz_lines = []
+
+        if xyz_lines:
+            write_lines(xyz_lines)
 
-    def dump_xyz_direct(self, dst_port=sys.stdout, encode=False):
+    def dump_xyz_direct(self, dst_port=sys.stdout, encode=False, include_w=None, include_u=None, precision=None):
         """dump the XYZ data from the dataset
 
-        data get dumped directly from `self.yield_xyz`, by-passing `self.xyz_yield`.
+        data get dumped directly from `self.yield_xyz_batch`, by-passing `self.xyz_yield`,
+        in the same format as `XYZPoint.dump`.
+
+        include_w/include_u default to whether the dataset has a weight/uncertainty
+        and precision defaults to `self.dump_precision`.
         """
-        
-        for this_xyz in self.yield_xyz():
-            this_xyz.dump(
-                include_w=True if self.weight is not None else False,
-                include_u=True if self.uncertainty is not None else False,
-                dst_port=dst_port,
-                encode=encode,
-                precision=self.dump_precision
-            )
 
-    def export_xyz_as_list(self, z_only = False):
-        """return the XYZ data from the dataset as python list
+        if include_w is None:
+            include_w = True if self.weight is not None else False
 
-        This may get very large, depending on the input data.
+        if include_u is None:
+            include_u = True if self.uncertainty is not None else False
+
+        if precision is None:
+            precision = self.dump_precision
+            
+        fmt = ' '.join(
+            ['%.8f', '%.8f'] + ['%.{}f'.format(precision)] * (1 + include_w + include_u)
+        )
+        for points_x, points_y, points_z, points_w, points_u in self.yield_xyz_batch():
+            dataset = [points_x, points_y, points_z]
+            if include_w:
+                dataset.append(points_w)
+
+            if include_u:
+                dataset.append(points_u)
+
+            out_buf = io.StringIO()
+            np.savetxt(out_buf, np.column_stack(dataset), fmt=fmt)
+            dst_port.write(out_buf.getvalue().encode('utf-8') if encode else out_buf.getvalue())
+
+    def export_xyz_as_list(self, z_only = False, chunk_size = 1000000):
+        """return the XYZ data from the dataset as a numpy array
+
+        if `z_only`, returns a float64 array of the z values, otherwise
+        returns a record array with x, y, z, w and u fields.
+
+        The points are gathered into preallocated float64 chunks rather
+        than a list of XYZPoint objects, but this may still get very
+        large, depending on the input data.
         """
 
-        return([xyz.z if z_only else xyz.copy() for xyz in self.xyz_yield])
+        xyz_fields = ['z'] if z_only else ['x', 'y', 'z', 'w', 'u']
+        xyz_chunks = []
+        xyz_buf = np.empty((chunk_size, len(xyz_fields)), dtype=np.float64)
+        n = 0
+        for xyz in self.xyz_yield:
+            if z_only:
+                xyz_buf[n, 0] = xyz.z
+            else:
+                xyz_buf[n] = (xyz.x, xyz.y, xyz.z, xyz.w, xyz.u)
+                
+            n += 1
+            if n == chunk_size:
+                xyz_chunks.append(xyz_buf)
+                xyz_buf = np.empty((chunk_size, len(xyz_fields)), dtype=np.float64)
+                n = 0
+
+        xyz_chunks.append(xyz_buf[:n])
+        xyz_array = np.concatenate(xyz_chunks) if len(xyz_chunks) > 1 else xyz_chunks[0]
+        if z_only:
+            return(xyz_array[:, 0])
+        
+        return(np.rec.fromarrays(
+            xyz_array.T, names=xyz_fields, formats=['f8'] * len(xyz_fields)
+        ))
             
+    @classmethod
+    def http_session(cls):
+        """the requests.Session of the calling thread, shared by the dataset fetches
+        made from that thread, so connections are kept-alive.
+
+        requests.Session isn't thread-safe, so each thread gets its own.
+        """
+
+        session = getattr(cls._http_sessions, 'session', None)
+        if session is None:
+            session = cls._http_sessions.session = fetches.requests.Session()
+            
+        return(session)
+        
     def fetch(self):
-        """fetch remote data from self.data_entries"""
+        """fetch remote data from the datasets found by `yield_entries`"""
         
-        for entry in self.data_entries:
+        for entry in self.yield_entries():
             if entry.remote:
                 if entry._fn is None:
                     entry._fn = os.path.basename(self.fn)
                     
-                f = utils.Fetch(
-                    url=entry.fn, verbose=entry.verbose
+                f = fetches.Fetch(
+                    url=entry.fn, verbose=entry.verbose, session=self.http_session()
                 )
                 if f.fetch_file(entry._fn) == 0:
                     entry.fn = entry._fn
@@ -1095,37 +1309,45 @@ class ElevationDataset:
                     if self.fn.startswith('http') or self.fn.startswith('/vsicurl/') or self.fn.startswith('BAG'):
                         if not utils.fn_url_p(self.fn):
                             if self.data_format > -10:
-                                if not os.path.exists(self.fn):
-                                    return (False)
-
-                                if os.stat(self.fn).st_size == 0:
+                                if not self.fn_stat_p():
                                     return(False)
                         
         return(True)
+
+    def fn_stat_p(self):
+        """check that `self.fn` exists and is not empty.
+
+        uses a single `os.stat` call and caches the result (keyed on `self.fn`),
+        so repeated `valid_p` calls during `inf`/`parse` don't re-stat the file.
+        """
+
+        if self._fn_stat is not None and self._fn_stat[0] == self.fn:
+            return(self._fn_stat[1])
+
+        try:
+            fn_ok = os.stat(self.fn).st_size != 0
+        except (OSError, TypeError, ValueError):
+            fn_ok = False
+
+        self._fn_stat = (self.fn, fn_ok)
+        return(fn_ok)
         
     def format_entry(self, sep=' '):
         """format the dataset information as a `sep` separated string."""
         
-        dl_entry = sep.join(
-            [str(x) for x in [
-                self.fn,
-                '{}:{}'.format(self.data_format, factory.dict2args(self.params['mod_args'])),
-                self.weight,
-                self.uncertainty
-            ]]
-        )
-        metadata = self.echo_()
-        return(sep.join([dl_entry, metadata]))
+        return(sep.join((
+            str(self.fn),
+            '{}:{}'.format(self.data_format, factory.dict2args(self.params['mod_args'])),
+            str(self.weight),
+            str(self.uncertainty),
+            self.echo_()
+        )))
         
     def echo_(self, sep=' ', **kwargs):
         """print self as a datalist entry string"""
 
-        out = []
-        for key in self.metadata.keys():
-            if key != 'name':
-                out.append(str(self.metadata[key]))
-
-        return(sep.join(['"{}"'.format(str(x)) for x in out]))
+        quote = '"{}"'.format
+        return(sep.join([quote(val) for key, val in self.metadata.items() if key != 'name']))
     
     def echo(self, **kwargs):
         """print self.data_entries as a datalist entries."""
@@ -1173,9 +1395,20 @@ class ElevationDataset:
         ## if hashes are different, then generate a new
         ## inf file...only do this if check_hash is set
         ## to True, as this can be time consuming and not
-        ## always necessary...
+        ## always necessary...if the file size and mtime match
+        ## what was recorded in the inf file, the file hasn't
+        ## changed and we skip the hash.
         if check_hash:
-            generate_inf = self.infos.generate_hash() != self.infos.file_hash
+            stat_sig = self.infos.generate_stat_sig()
+            if stat_sig is None or stat_sig != self.infos.stat_sig:
+                inf_hash = self.infos.file_hash
+                generate_inf = generate_inf or self.infos.generate_hash() != inf_hash
+                ## the file was touched but not changed, record the new
+                ## signature so the next check can skip the hash
+                if not generate_inf and stat_sig is not None \
+                   and self.data_format >= -1 and write_inf:
+                    self.infos.stat_sig = stat_sig
+                    self.infos.write_inf_file()
 
         ## this being set can break some modules (bags esp)
         # if self.remote:
@@ -1183,6 +1416,7 @@ class ElevationDataset:
 
         if generate_inf:
             self.infos = self.generate_inf()
+            self.infos.stat_sig = self.infos.generate_stat_sig(self.fn)
             
             ## update this
             if self.data_format >= -1 and write_inf:
@@ -1205,6 +1439,39 @@ class ElevationDataset:
 
         return(self.infos)
 
+    def inf_region(self):
+        """the region of the dataset, from the inf minmax or wkt.
+
+        the minmax is used when it holds a valid region, the wkt is only
+        parsed (through ogr) otherwise. only the xy extent of the minmax is
+        used; the z range is in the source vertical datum and would wrongly
+        exclude the dataset when compared with a region that has z bounds.
+
+        the region is built once and re-used until the inf extent changes,
+        don't modify the returned region in place.
+        """
+
+        inf_key = (self.infos.wkt, str(self.infos.minmax))
+        if self._inf_region is None or self._inf_region[0] != inf_key:
+            inf_region = None
+            if self.infos.minmax:
+                try:
+                    inf_region = regions.Region().from_list(self.infos.minmax[:4])
+                    if not inf_region.valid_p(check_xy=True):
+                        inf_region = None
+                except:
+                    inf_region = None
+
+            if inf_region is None and self.infos.wkt:
+                try:
+                    inf_region = regions.Region().from_string(self.infos.wkt)
+                except:
+                    inf_region = None
+
+            self._inf_region = (inf_key, inf_region)
+            
+        return(self._inf_region[1])
+        
     def set_transform(self):
         """Set the pyproj horizontal and vertical transformations for the dataset"""
         
@@ -1241,11 +1508,20 @@ class ElevationDataset:
                 )
                     
             try:
-                in_crs = pyproj.CRS.from_user_input(src_srs)
+                in_crs = _crs_from_user_input(src_srs)
             except:
                 utils.echo_error_msg(src_srs)
                     
-            out_crs = pyproj.CRS.from_user_input(dst_srs)
+            out_crs = _crs_from_user_input(dst_srs)
+
+            ## the srs' are equivalent, though maybe not string-equal (e.g. 'EPSG:4326'
+            ## and 'epsg:4326'), and there is no geoid/esri vertical to apply, so
+            ## there is nothing to transform; skip building the transformers.
+            if self.src_geoid is None and in_vertical_epsg_esri is None and in_crs == out_crs:
+                horizontal_proj4 = (in_crs.sub_crs_list[0] if in_crs.is_compound else in_crs).to_proj4()
+                self.src_proj4 = self.dst_proj4 = horizontal_proj4
+                self.transformer = None
+                return(self._set_data_region())
 
             if in_crs.is_compound:
                 in_crs_list = in_crs.sub_crs_list
@@ -1283,9 +1559,7 @@ class ElevationDataset:
                     
             ## horizontal Transformation
             try:
-                self.transformer = pyproj.Transformer.from_crs(
-                    in_horizontal_crs, out_horizontal_crs, always_xy=True
-                )
+                self.transformer = _transformer_from_crs(in_horizontal_crs, out_horizontal_crs)
             except Exception as e:
                 utils.echo_warning_msg('could not set transformation in: {}, out: {}, {}'.format(
                     in_horizontal_crs.name, out_horizontal_crs.name, e
@@ -1293,22 +1567,37 @@ class ElevationDataset:
                 self.transformer = None
                 return
 
+            ## the proj4 strings are re-used below, export them once
+            in_horizontal_proj4 = in_horizontal_crs.to_proj4()
+            out_horizontal_proj4 = out_horizontal_crs.to_proj4()
+            
+            ## transform the region to the source srs with the already parsed crs objects,
+            ## rather than re-parsing the proj4 strings with `Region.warp`
+            ## the datasets of a datalist share the region and usually the srs pair,
+            ## so the transformed region is cached (see `_trans_region`) and copied
+            ## out for each dataset.
             if self.region is not None:
-                self.trans_region = self.region.copy()
-                self.trans_region.src_srs = out_horizontal_crs.to_proj4()
-                self.trans_region.warp(in_horizontal_crs.to_proj4())
+                self.trans_region = _trans_region(
+                    tuple(self.region.export_as_list(include_z=True, include_w=True, include_u=True)),
+                    in_horizontal_proj4, in_horizontal_crs, out_horizontal_crs
+                ).copy()
+
+            self.src_proj4 = in_horizontal_proj4
+            self.dst_proj4 = out_horizontal_proj4
+
+            ## the horizontal crs' are the same and there is no vertical transformation,
+            ## don't pass every chunk of points through a no-op transformation
+            if not want_vertical and in_horizontal_crs == out_horizontal_crs:
+                self.transformer = None
 
-            self.src_proj4 = in_horizontal_crs.to_proj4()
-            self.dst_proj4 = out_horizontal_crs.to_proj4()
-                
             ## vertical Transformation
             if want_vertical:
                 if self.region is None:
                     vd_region = regions.Region().from_list(self.infos.minmax)
-                    vd_region.src_srs = in_horizontal_crs.to_proj4()
+                    vd_region.src_srs = in_horizontal_proj4
                 else:
                     vd_region = self.region.copy()
-                    vd_region.src_srs = out_horizontal_crs.to_proj4()
+                    vd_region.src_srs = out_horizontal_proj4
                     
                 vd_region.warp('epsg:4326')
                 if not vd_region.valid_p():
@@ -1319,15 +1608,22 @@ class ElevationDataset:
                 vd_region.zmax = None
                 vd_region.buffer(pct=10)
                 
-                ## trans_fn is the transformation grid, used in gdalwarp
+                ## trans_fn is the transformation grid, used in gdalwarp; it is named by
+                ## the vertical datums, geoids and region, so a grid already generated
+                ## for another dataset with the same ones is re-used.
                 self.trans_fn = os.path.join(
-                    self.cache_dir, '_vdatum_trans_{}_{}_{}.tif'.format(
-                        in_vertical_epsg, out_vertical_epsg, vd_region.format('fn')
+                    self.cache_dir, '_vdatum_trans_{}_{}_{}_{}_{}.tif'.format(
+                        in_vertical_epsg, out_vertical_epsg, src_geoid, dst_geoid, vd_region.format('fn')
                     )
                 )
-
+                    
                 ## vertical transformation grid is generated in WGS84
-                if not os.path.exists(self.trans_fn):
+                if os.path.exists(self.trans_fn):
+                    ## the uncertainty grid generated along with it, see `vdatums.VerticalTransform.run`
+                    trans_fn_unc = '{}_unc.{}'.format(utils.fn_basename2(self.trans_fn), utils.fn_ext(self.trans_fn))
+                    if os.path.exists(trans_fn_unc):
+                        self.trans_fn_unc = trans_fn_unc
+                else:
                     with tqdm(
                             desc='generating vertical transformation grid {} from {} to {}'.format(
                                 self.trans_fn, in_vertical_epsg, out_vertical_epsg
@@ -1367,7 +1663,7 @@ class ElevationDataset:
                     #         )
                     #     )
                     out_src_srs = '{} +geoidgrids={}'.format(
-                        in_horizontal_crs.to_proj4(), self.trans_fn
+                        in_horizontal_proj4, self.trans_fn
                     )
                     if utils.str_or(in_vertical_epsg) == '6360':# or 'us-ft' in utils.str_or(src_vert, ''):
                         out_src_srs = out_src_srs + ' +vto_meter=0.3048006096012192'
@@ -1383,23 +1679,27 @@ class ElevationDataset:
                         )
                     )
                 
-                in_vertical_crs = pyproj.CRS.from_user_input(out_src_srs)
+                in_vertical_crs = _crs_from_user_input(out_src_srs)
                 self.src_proj4 = in_vertical_crs.to_proj4()
-                self.dst_proj4 = out_horizontal_crs.to_proj4()
-                self.aux_src_proj4 = in_horizontal_crs.to_proj4()
-                self.aux_dst_proj4 = out_horizontal_crs.to_proj4()
+                self.dst_proj4 = out_horizontal_proj4
+                self.aux_src_proj4 = in_horizontal_proj4
+                self.aux_dst_proj4 = out_horizontal_proj4
                 if self.region is not None:
-                    aoi = pyproj.aoi.AreaOfInterest(
+                    aoi_bounds = (
                         self.region.xmin, self.region.ymin, self.region.xmax, self.region.ymax
                     )
                 else:
-                    aoi = None
+                    aoi_bounds = None
 
-                self.transformer = pyproj.Transformer.from_crs(
-                    in_vertical_crs, out_horizontal_crs, always_xy=True, area_of_interest=aoi
+                self.transformer = _transformer_from_crs(
+                    in_vertical_crs, out_horizontal_crs, aoi_bounds=aoi_bounds
                 )
 
-        ## dataset region
+        self._set_data_region()
+
+    def _set_data_region(self):
+        """set the dataset region, self.region (or self.trans_region) reduced by the inf region"""
+        
         if self.region is not None and self.region.valid_p():
             self.data_region = self.region.copy() if self.trans_region is None else self.trans_region.copy()
             inf_region = regions.Region().from_list(self.infos.minmax)
@@ -1427,13 +1727,9 @@ class ElevationDataset:
         """
 
         if self.region is not None:
-            try:
-                inf_region = regions.Region().from_string(self.infos.wkt)
-            except:
-                try:
-                    inf_region = regions.Region().from_list(self.infos.minmax)
-                except:
-                    inf_region = self.region.copy()
+            inf_region = self.inf_region()
+            if inf_region is None:
+                inf_region = self.region.copy()
 
             if regions.regions_intersect_p(
                     inf_region,
@@ -1451,11 +1747,9 @@ class ElevationDataset:
         
         for e in self.parse():
             if e.parent is not None:
-                if e.parent.metadata['name'] in self.data_lists.keys():
-                    self.data_lists[e.parent.metadata['name']]['data'].append(e)
-                else:
-                    self.data_lists[e.parent.metadata['name']] = {'data': [e], 'parent': e.parent}
-                    
+                self.data_lists.setdefault(
+                    e.parent.metadata['name'], {'data': [], 'parent': e.parent}
+                )['data'].append(e)
             else:
                 self.data_lists[e.metadata['name']] = {'data': [e], 'parent': e}
                 
@@ -1588,22 +1882,28 @@ class ElevationDataset:
                                     os.path.relpath(this_xyz_path, os.path.dirname(sub_sub_dlf_path))
                                 )
                             )
-                            with open(this_xyz_path, 'w') as xp:
-                                for this_xyz in this_entry.xyz_yield: # data will be processed independently of each other
-                                    #yield(this_xyz) # don't need to yield data here.
-                                    this_xyz.dump(include_w=True if self.weight is not None else False,
-                                                  include_u=True if self.uncertainty is not None else False,
-                                                  dst_port=xp, encode=False)
+                            ## data will be processed independently of each other,
+                            ## and written out in batches through a 1MiB buffer
+                            with open(this_xyz_path, 'w', buffering=1<<20) as xp:
+                                this_entry.dump_xyz(
+                                    dst_port=xp, encode=False,
+                                    include_w=True if self.weight is not None else False,
+                                    include_u=True if self.uncertainty is not None else False,
+                                    precision=6
+                                )
                             sub_sub_dlf.close()
                             
                         else:
                             sub_dlf.write('{} 168 1 0\n'.format(sub_xyz_path))
-                            with open(this_xyz_path, 'w') as xp:
-                                for this_xyz in this_entry.xyz_yield: # data will be processed independently of each other
-                                    #yield(this_xyz) # don't need to yield data here.
-                                    this_xyz.dump(include_w=True if self.weight is not None else False,
-                                                  include_u=True if self.uncertainty is not None else False,
-                                                  dst_port=xp, encode=False, precision=self.dump_precision)
+                            ## data will be processed independently of each other,
+                            ## and written out in batches through a 1MiB buffer
+                            with open(this_xyz_path, 'w', buffering=1<<20) as xp:
+                                this_entry.dump_xyz(
+                                    dst_port=xp, encode=False,
+                                    include_w=True if self.weight is not None else False,
+                                    include_u=True if self.uncertainty is not None else False,
+                                    precision=self.dump_precision
+                                )
                                 
         ## generate datalist inf/json
         this_archive = DatasetFactory(
@@ -1664,6 +1964,9 @@ class ElevationDataset:
           count
           uncertainty
           src uncertainty
+
+        the stacks are accumulated in float32, as they are stored, so the weighted
+        sums and variances carry ~7 significant digits.
         """
 
         utils.set_cache(self.cache_dir)
@@ -1713,7 +2016,7 @@ class ElevationDataset:
             ycount,
             7,
             gdt,
-            options=['COMPRESS=LZW', 'PREDICTOR=2', 'TILED=YES', 'BIGTIFF=YES'] if fmt != 'MEM' else []
+            options=['COMPRESS=LZW', 'PREDICTOR=2', 'TILED=YES', 'BLOCKXSIZE=512', 'BLOCKYSIZE=512', 'BIGTIFF=YES'] if fmt != 'MEM' else []
         )
 
         if dst_ds is None:
@@ -1725,44 +2028,43 @@ class ElevationDataset:
             sys.exit(-1)
 
         dst_ds.SetGeoTransform(dst_gt)
-        stacked_bands = {
-            'z': dst_ds.GetRasterBand(1),
-            'count': dst_ds.GetRasterBand(2),
-            'weights': dst_ds.GetRasterBand(3),
-            'uncertainty': dst_ds.GetRasterBand(4),
-            'src_uncertainty': dst_ds.GetRasterBand(5),
-            'x': dst_ds.GetRasterBand(6),
-            'y': dst_ds.GetRasterBand(7)
-        }
-        stacked_data = {
-            'z': None,
-            'count': None,
-            'weights': None,
-            'uncertainty': None,
-            'src_uncertainty': None,
-            'x': None,
-            'y': None
-        }        
+        ## the stacked planes are held in a single (band, row, col) array, in band order;
+        ## stacked_data maps each band name to its (contiguous) plane of that array
+        stack_keys = ('z', 'count', 'weights', 'uncertainty', 'src_uncertainty', 'x', 'y')
+        stacked_bands = {key: dst_ds.GetRasterBand(i + 1) for i, key in enumerate(stack_keys)}
+        stacked_data = {key: None for key in stack_keys}
         for key in stacked_bands.keys():
             stacked_bands[key].SetNoDataValue(np.nan)
             stacked_bands[key].SetDescription(key)
 
+        ## accumulate the stacks in memory when they fit, rather than reading, writing
+        ## and re-compressing every incoming srcwin through the output raster; the
+        ## accumulated planes are written to the output raster once all the data is stacked.
+        ## larger stacks are accumulated through the output raster.
+        stacked_planes = None
+        if not mask_only and xcount * ycount * len(stack_keys) * 4 <= self.stack_max_memory:
+            stacked_planes = np.full((len(stack_keys), ycount, xcount), np.nan, dtype=np.float32)
+
         ## incoming arrays arrs['z'], arrs['weight'] arrs['uncertainty'], and arrs['count']
         ## srcwin is the srcwin of the waffle relative to the incoming arrays
         ## gt is the geotransform of the incoming arrays
         ## mask grid
+        ## the mask bands only hold 0 (no data) or 1 (data), so store them as bytes
+        m_gdt = gdal.GDT_Byte
         driver = gdal.GetDriverByName('MEM')
-        m_ds = driver.Create(utils.make_temp_fn(out_name), xcount, ycount, 0, gdt)
+        m_ds = driver.Create(utils.make_temp_fn(out_name), xcount, ycount, 0, m_gdt)
         m_ds.SetGeoTransform(dst_gt)
         
         ## initialize data mask        
         ## parse each entry and process it
         ## todo: mask here instead of in each dataset module
+        ## m_bands maps the mask band names to their band numbers, it is filled as the bands are added
+        m_bands = {}
         for this_entry in self.parse():
             ## MASK
-            m_bands = {m_ds.GetRasterBand(i).GetDescription(): i for i in range(1, m_ds.RasterCount + 1)}
-            if not this_entry.metadata['name'] in m_bands.keys():
-                m_ds.AddBand()
+            if not this_entry.metadata['name'] in m_bands:
+                m_ds.AddBand(m_gdt)
+                m_bands[this_entry.metadata['name']] = m_ds.RasterCount
                 m_band = m_ds.GetRasterBand(m_ds.RasterCount)
                 m_band.SetNoDataValue(0)
                 m_band.SetDescription(this_entry.metadata['name'])
@@ -1802,31 +2104,38 @@ class ElevationDataset:
                 
                 m_ds.FlushCache()
                 ## Read the saved accumulated rasters at the incoming srcwin and set ndv to zero
-                for key in stacked_bands.keys():
-                    stacked_data[key] = stacked_bands[key].ReadAsArray(
-                        srcwin[0], srcwin[1], srcwin[2], srcwin[3]
-                    )
-                    if mode != 'min' and mode != 'max':
-                        stacked_data[key][np.isnan(stacked_data[key])] = 0
-                    #else:
-                    if key == 'count':
-                        stacked_data[key][np.isnan(stacked_data[key])] = 0
+                stack_slice = (slice(None), slice(srcwin[1], srcwin[1] + srcwin[3]), slice(srcwin[0], srcwin[0] + srcwin[2]))
+                if stacked_planes is not None:
+                    stacked = stacked_planes[stack_slice]
+                else:
+                    stacked = np.empty((len(stack_keys), srcwin[3], srcwin[2]), dtype=np.float32)
+                    for i, key in enumerate(stack_keys):
+                        stacked[i] = stacked_bands[key].ReadAsArray(
+                            srcwin[0], srcwin[1], srcwin[2], srcwin[3]
+                        )
+
+                stacked_data = dict(zip(stack_keys, stacked))
+                    
+                ## nan_to_num zeroes the nans in place in a single pass, inf are kept as is
+                if mode != 'min' and mode != 'max':
+                    np.nan_to_num(stacked, copy=False, nan=0, posinf=np.inf, neginf=-np.inf)
+                else:
+                    np.nan_to_num(stacked_data['count'], copy=False, nan=0, posinf=np.inf, neginf=-np.inf)
                     
                 ## set incoming np.nans to zero and mask to non-nan count
-                arrs['count'][np.isnan(arrs['count'])] = 0
-                arrs['weight'][np.isnan(arrs['z'])] = 0
-                arrs['uncertainty'][np.isnan(arrs['z'])] = 0
+                ## (the z nan mask is computed once and shared by weight and uncertainty)
+                z_nan = np.isnan(arrs['z'])
+                arrs['weight'][z_nan] = 0
+                arrs['uncertainty'][z_nan] = 0
                 
                 if mode != 'min' and mode != 'max':
                     #arrs['weight'][np.isnan(arrs['z'])] = 0
                     #arrs['uncertainty'][np.isnan(arrs['z'])] = 0
-                    arrs['x'][np.isnan(arrs['x'])] = 0
-                    arrs['y'][np.isnan(arrs['y'])] = 0
-                    arrs['z'][np.isnan(arrs['z'])] = 0
                     for arr_key in arrs:
                         if arrs[arr_key] is not None:
-                            arrs[arr_key][np.isnan(arrs[arr_key])] = 0
-                #else:
+                            np.nan_to_num(arrs[arr_key], copy=False, nan=0, posinf=np.inf, neginf=-np.inf)
+                else:
+                    np.nan_to_num(arrs['count'], copy=False, nan=0, posinf=np.inf, neginf=-np.inf)
 
 
                 ## add the count to the accumulated rasters
@@ -1836,15 +2145,18 @@ class ElevationDataset:
                 ## todo: do (weighted) mean on cells with same weight
                 if mode == 'supercede':
                     ## higher weight supercedes lower weight (first come first served atm)
-                    stacked_data['z'][arrs['weight'] > stacked_data['weights']] = arrs['z'][arrs['weight'] > stacked_data['weights']]
-                    stacked_data['x'][arrs['weight'] > stacked_data['weights']] = arrs['x'][arrs['weight'] > stacked_data['weights']]
-                    stacked_data['y'][arrs['weight'] > stacked_data['weights']] = arrs['y'][arrs['weight'] > stacked_data['weights']]
-                    stacked_data['src_uncertainty'][arrs['weight'] > stacked_data['weights']] = arrs['uncertainty'][arrs['weight'] > stacked_data['weights']]
-                    stacked_data['weights'][arrs['weight'] > stacked_data['weights']] = arrs['weight'][arrs['weight'] > stacked_data['weights']]
+                    ## build the superceding mask once, before the weights are updated
+                    ## and copy through it in place, without gathering the masked values first
+                    sup_mask = arrs['weight'] > stacked_data['weights']
+                    np.copyto(stacked_data['z'], arrs['z'], where=sup_mask, casting='unsafe')
+                    np.copyto(stacked_data['x'], arrs['x'], where=sup_mask, casting='unsafe')
+                    np.copyto(stacked_data['y'], arrs['y'], where=sup_mask, casting='unsafe')
+                    np.copyto(stacked_data['src_uncertainty'], arrs['uncertainty'], where=sup_mask, casting='unsafe')
+                    np.copyto(stacked_data['weights'], arrs['weight'], where=sup_mask, casting='unsafe')
                     #stacked_data['weights'][stacked_data['weights'] == 0] = np.nan
                     ## uncertainty is src_uncertainty, as only one point goes into a cell
                     #stacked_data['uncertainty'][:] = stacked_data['src_uncertainty'][:]
-                    stacked_data['uncertainty'][:] = np.array(stacked_data['src_uncertainty'])
+                    np.copyto(stacked_data['uncertainty'], stacked_data['src_uncertainty'])
 
                     # ## reset all data where weights are zero to nan
                     # for key in stacked_bands.keys():
@@ -1880,7 +2192,12 @@ class ElevationDataset:
                     stacked_data['weights'][mask][stacked_data['weights'][mask] == 0] = np.nan
                     
                     ## accumulate variance * weight
-                    stacked_data['uncertainty'][mask] += arrs['weight'][mask] * np.power((arrs['z'][mask] - (stacked_data['z'][mask] / stacked_data['weights'][mask])), 2)
+                    ## (squared by multiplication, so the float32 stacks aren't promoted to float64)
+                    stack_tmp = np.subtract(arrs['z'][mask], stacked_data['z'][mask] / stacked_data['weights'][mask], dtype=np.float32)
+                    stack_tmp *= stack_tmp
+                    stack_tmp *= arrs['weight'][mask]
+                    stacked_data['uncertainty'][mask] += stack_tmp
+                    stack_tmp = None
                     stacked_data['z'][mask] = arrs['z'][mask]
                     
                 # elif mode == 'median':
@@ -1891,33 +2208,47 @@ class ElevationDataset:
                 #     stacked_data['src_uncertainty'] += np.median(arrs['uncertainty'])
                     
                 elif mode == 'mean':
-                    ## accumulate incoming z*weight and uu*weight
-                    stacked_data['z'] += (arrs['z'] * arrs['weight'])
-                    stacked_data['x'] += (arrs['x'] * arrs['weight'])
-                    stacked_data['y'] += (arrs['y'] * arrs['weight'])
+                    ## accumulate incoming z*weight and uu*weight, the products go
+                    ## through one scratch array rather than a temporary per operation
+                    stack_tmp = np.multiply(arrs['z'], arrs['weight'], dtype=np.float32)
+                    stacked_data['z'] += stack_tmp
+                    np.multiply(arrs['x'], arrs['weight'], out=stack_tmp)
+                    stacked_data['x'] += stack_tmp
+                    np.multiply(arrs['y'], arrs['weight'], out=stack_tmp)
+                    stacked_data['y'] += stack_tmp
                     #stacked_data['src_uncertainty'] += (arrs['uncertainty'] * arrs['weight'])
-                    stacked_data['src_uncertainty'] = np.sqrt(np.power(stacked_data['src_uncertainty'], 2) + np.power(arrs['uncertainty'], 2))
+                    ## sqrt(src_u**2 + u**2)
+                    np.hypot(stacked_data['src_uncertainty'], arrs['uncertainty'], out=stacked_data['src_uncertainty'])
                     
                     ## accumulate incoming weights (weight*weight?) and set results to np.nan for calcs
                     stacked_data['weights'] += arrs['weight']
                     stacked_data['weights'][stacked_data['weights'] == 0] = np.nan
                     
                     ## accumulate variance * weight
-                    stacked_data['uncertainty'] += arrs['weight'] * np.power((arrs['z'] - (stacked_data['z'] / stacked_data['weights'])), 2)
+                    np.divide(stacked_data['z'], stacked_data['weights'], out=stack_tmp)
+                    np.subtract(arrs['z'], stack_tmp, out=stack_tmp)
+                    np.square(stack_tmp, out=stack_tmp)
+                    stack_tmp *= arrs['weight']
+                    stacked_data['uncertainty'] += stack_tmp
+                    stack_tmp = None
 
                 ## write out results to accumulated rasters
                 #stacked_data['count'][stacked_data['count'] == 0] = ndv
-                stacked_data['count'][stacked_data['count'] == 0] = np.nan
-
-                for key in stacked_bands.keys():
+                ## cells with no count are nan in every plane, set them all at once
+                stacked[:, stacked_data['count'] == 0] = np.nan
+                #for key in stacked_bands.keys():
                     #stacked_data[key][np.isnan(stacked_data[key])] = ndv
                     #stacked_data[key][stacked_data['count'] == ndv] = ndv
-                    
-                    stacked_data[key][np.isnan(stacked_data['count'])] = np.nan
                     #if mode != 'mean':
                     #    stacked_data[key][np.isnan(stacked_data[key])] = ndv
 
-                    stacked_bands[key].WriteArray(stacked_data[key], srcwin[0], srcwin[1])
+                ## the in-memory planes were updated in place, otherwise write them back out
+                if stacked_planes is None:
+                    for i, key in enumerate(stack_keys):
+                        stacked_bands[key].WriteArray(stacked[i], srcwin[0], srcwin[1])
+
+                stacked = None
+
 
         ## Finalize weighted mean rasters and close datasets
         ## incoming arrays have all been processed, if weighted mean the
@@ -1930,7 +2261,7 @@ class ElevationDataset:
             #m_ds.FlushCache()
             ## create a new mem ds to hold valid bands
             driver = gdal.GetDriverByName('MEM')
-            mm_ds = driver.Create(utils.make_temp_fn(out_name), xcount, ycount, 0, gdt)
+            mm_ds = driver.Create(utils.make_temp_fn(out_name), xcount, ycount, 0, m_gdt)
             mm_ds.SetGeoTransform(dst_gt)
 
             for band_num in range(1, m_ds.RasterCount+1):
@@ -1938,7 +2269,7 @@ class ElevationDataset:
                 if not np.isnan(band_infos['zr'][0]) and not np.isnan(band_infos['zr'][1]):
                     m_band = m_ds.GetRasterBand(band_num)
                     m_band_md = m_band.GetMetadata()
-                    mm_ds.AddBand()
+                    mm_ds.AddBand(m_gdt)
                     mm_band = mm_ds.GetRasterBand(mm_ds.RasterCount)
                     mm_band.SetNoDataValue(0)
                     mm_band.SetDescription(m_band.GetDescription())
@@ -1968,35 +2299,46 @@ class ElevationDataset:
             #         stacked_data[key] = stacked_bands[key].ReadAsArray(*srcwin)
             #         stacked_data[key][stacked_data[key] == ndv] = np.nan
 
-            ## by scan-line
-            srcwin = (0, 0, dst_ds.RasterXSize, dst_ds.RasterYSize)
-            for y in range(
-                    srcwin[1], srcwin[1] + srcwin[3], 1
-            ):
-                for key in stacked_bands.keys():
-                    stacked_data[key] = stacked_bands[key].ReadAsArray(srcwin[0], y, srcwin[2], 1)
+            ## by strips of rows (~4M cells), from the in-memory stacks if they were
+            ## accumulated there, otherwise from the output raster
+            ## the strips are a whole number of blocks high, so each (compressed) block is written once
+            strip_rows = max(1, min(ycount, (4 * 1024 * 1024) // xcount))
+            block_rows = stacked_bands['z'].GetBlockSize()[1]
+            if block_rows > 1 and strip_rows < ycount:
+                strip_rows = max(block_rows, (strip_rows // block_rows) * block_rows)
+                
+            for y in range(0, ycount, strip_rows):
+                rows = min(strip_rows, ycount - y)
+                for i, key in enumerate(stack_keys):
+                    if stacked_planes is not None:
+                        stacked_data[key] = stacked_planes[i, y:y + rows]
+                    else:
+                        stacked_data[key] = stacked_bands[key].ReadAsArray(0, y, xcount, rows)
+                        
                     stacked_data[key][stacked_data[key] == ndv] = np.nan
 
                 if mode == 'mean' or mode == 'min' or mode == 'max':
-                    stacked_data['weights'] = stacked_data['weights'] / stacked_data['count']
-                    if mode == 'mean':
-                        ## average the accumulated arrays for finalization
-                        ## x, y, z and u are weighted sums, so divide by weights
-                        stacked_data['x'] = (stacked_data['x'] / stacked_data['weights']) / stacked_data['count']
-                        stacked_data['y'] = (stacked_data['y'] / stacked_data['weights']) / stacked_data['count']
-                        stacked_data['z'] = (stacked_data['z'] / stacked_data['weights']) / stacked_data['count']
-                    
-                    ## apply the source uncertainty with the sub-cell variance uncertainty
-                    ## caclulate the standard error (sqrt( uncertainty / count))
-                    #stacked_data['src_uncertainty'] = np.sqrt((stacked_data['src_uncertainty'] / stacked_data['weights']) / stacked_data['count'])
-                    stacked_data['uncertainty'] = np.sqrt((stacked_data['uncertainty'] / stacked_data['weights']) / stacked_data['count'])
-                    stacked_data['uncertainty'] = np.sqrt(np.power(stacked_data['src_uncertainty'], 2) + np.power(stacked_data['uncertainty'], 2))
-                    #stacked_data['uncertainty'] = np.sqrt(stacked_data['uncertainty'] / stacked_data['count'])
+                    ## empty cells are nan (count is nan), skip the per-element warnings
+                    with np.errstate(invalid='ignore', divide='ignore'):
+                        stacked_data['weights'] = stacked_data['weights'] / stacked_data['count']
+                        if mode == 'mean':
+                            ## average the accumulated arrays for finalization
+                            ## x, y, z and u are weighted sums, so divide by weights
+                            stacked_data['x'] = (stacked_data['x'] / stacked_data['weights']) / stacked_data['count']
+                            stacked_data['y'] = (stacked_data['y'] / stacked_data['weights']) / stacked_data['count']
+                            stacked_data['z'] = (stacked_data['z'] / stacked_data['weights']) / stacked_data['count']
+
+                        ## apply the source uncertainty with the sub-cell variance uncertainty
+                        ## caclulate the standard error (sqrt( uncertainty / count))
+                        stacked_data['uncertainty'] = np.sqrt((stacked_data['uncertainty'] / stacked_data['weights']) / stacked_data['count'])
+                        stacked_data['uncertainty'] = np.hypot(stacked_data['src_uncertainty'], stacked_data['uncertainty'])
 
                 ## write out final rasters
                 for key in stacked_bands.keys():
                     stacked_data[key][np.isnan(stacked_data[key])] = ndv
-                    stacked_bands[key].WriteArray(stacked_data[key], srcwin[0], y)
+                    stacked_bands[key].WriteArray(stacked_data[key], 0, y)
+
+            stacked_planes = None
                 
             ## set the final output nodatavalue
             for key in stacked_bands.keys():
@@ -2024,7 +2366,20 @@ class ElevationDataset:
         return(out_file)        
     
     def stacks_yield_xyz(self, out_name = None, ndv = -9999, fmt = 'GTiff'):#, mode = 'mean'):
-        """yield the result of `_stacks` as an xyz object"""
+        """yield the result of `_stacks` as an xyz object
+
+        the points come from `self.stacks_yield_xyz_batch`, use that directly
+        when the data can be processed as arrays.
+        """
+
+        for sx, sy, sz, sw, su in self.stacks_yield_xyz_batch(out_name=out_name, ndv=ndv, fmt=fmt):
+            for geo_x, geo_y, z, w, u in zip(sx.tolist(), sy.tolist(), sz.tolist(), sw.tolist(), su.tolist()):
+                yield(xyzfun.XYZPoint(x=geo_x, y=geo_y, z=z, w=w, u=u))
+                
+    def stacks_yield_xyz_batch(self, out_name = None, ndv = -9999, fmt = 'GTiff'):
+        """yield the result of `_stacks` as batches of x, y, z, w, u arrays,
+        one batch per strip of the stacked raster with data.
+        """
 
         stacked_fn = self._stacks(out_name=out_name, ndv=ndv, fmt=fmt)#, mode=mode)
         sds = gdal.Open(stacked_fn)
@@ -2035,31 +2390,28 @@ class ElevationDataset:
         sds_x_band = sds.GetRasterBand(6) # the x band from stacks
         sds_y_band = sds.GetRasterBand(7) # the y band from stacks
         srcwin = (0, 0, sds.RasterXSize, sds.RasterYSize)
-        for y in range(srcwin[1], srcwin[1] + srcwin[3], 1):
-            sz = sds_z_band.ReadAsArray(srcwin[0], y, srcwin[2], 1)
-            ## skip row if all values are ndv
-            if np.all(sz == ndv):
+        ## read the stack in strips of whole blocks rather than row-by-row; the
+        ## weight/uncertainty/x/y bands are only read for strips with data
+        n_rows = max(sds_z_band.GetBlockSize()[1], 256)
+        n_rows = max(1, min(n_rows, 4194304 // max(srcwin[2], 1)))
+        for y0 in range(srcwin[1], srcwin[1] + srcwin[3], n_rows):
+            y_size = min(n_rows, srcwin[1] + srcwin[3] - y0)
+            sz = sds_z_band.ReadAsArray(srcwin[0], y0, srcwin[2], y_size)
+            y_idx, x_idx = np.nonzero(sz != ndv)
+            ## skip strip if all values are ndv
+            if len(x_idx) == 0:
                 continue
             
-            sw = sds_w_band.ReadAsArray(srcwin[0], y, srcwin[2], 1)
-            su = sds_u_band.ReadAsArray(srcwin[0], y, srcwin[2], 1)
-
-            sx = sds_x_band.ReadAsArray(srcwin[0], y, srcwin[2], 1)
-            sy = sds_y_band.ReadAsArray(srcwin[0], y, srcwin[2], 1)
-            for x in range(0, sds.RasterXSize):
-                z = sz[0, x]
-                if z != ndv:
-                    if self.stack_node: # yield avg x/y data instead of center
-                        out_xyz = xyzfun.XYZPoint(
-                            x = sx[0, x], y = sy[0, x], z = z, w = sw[0, x], u = su[0, x]
-                        )
-                    else: # yield center of pixel as x/y
-                        geo_x, geo_y = utils._pixel2geo(x, y, sds_gt)
-                        out_xyz = xyzfun.XYZPoint(
-                            x=geo_x, y=geo_y, z=z, w=sw[0, x], u=su[0, x]
-                        )
-                        
-                    yield(out_xyz)
+            sw = sds_w_band.ReadAsArray(srcwin[0], y0, srcwin[2], y_size)[y_idx, x_idx]
+            su = sds_u_band.ReadAsArray(srcwin[0], y0, srcwin[2], y_size)[y_idx, x_idx]
+            if self.stack_node: # yield avg x/y data instead of center
+                sx = sds_x_band.ReadAsArray(srcwin[0], y0, srcwin[2], y_size)[y_idx, x_idx]
+                sy = sds_y_band.ReadAsArray(srcwin[0], y0, srcwin[2], y_size)[y_idx, x_idx]
+            else: # yield center of pixel as x/y
+                sx, sy = utils._pixel2geo(x_idx + srcwin[0], y_idx + y0, sds_gt)
+                
+            yield(np.asarray(sx), np.asarray(sy), sz[y_idx, x_idx], sw, su)
+                
         sds = None
     
     def vectorize_xyz(self):
@@ -2082,18 +2434,21 @@ class ElevationDataset:
             fd.SetPrecision(8)
             layer.CreateField(fd)
             
-        f = ogr.Feature(feature_def=layer.GetLayerDefn())        
+        ## re-use a single feature and point geometry, setting the point
+        ## coordinates directly rather than building and parsing a wkt per point
+        f = ogr.Feature(feature_def=layer.GetLayerDefn())
+        g = ogr.Geometry(ogr.wkbPoint25D)
+        layer.StartTransaction()
         for this_xyz in self.xyz_yield:
             f.SetField(0, this_xyz.x)
             f.SetField(1, this_xyz.y)
             f.SetField(2, this_xyz.z)
             f.SetField(3, this_xyz.w)
-                
-            wkt = this_xyz.export_as_wkt(include_z=True)
-            g = ogr.CreateGeometryFromWkt(wkt)
-            f.SetGeometryDirectly(g)
+            g.SetPoint(0, this_xyz.x, this_xyz.y, this_xyz.z)
+            f.SetGeometry(g)
             layer.CreateFeature(f)
-            
+
+        layer.CommitTransaction()
         return(ogr_ds)
 
     def yield_points(self):
@@ -2104,6 +2459,15 @@ class ElevationDataset:
         yield the transformed and reduced points.
         """
             
+        ## the region doesn't change from chunk to chunk, validate it and look up
+        ## its bounds once (the transformer may still be reset by `yield_ds`, e.g.
+        ## when a raster is warped, so that is checked per chunk)
+        xyz_region = None
+        if self.region is not None and self.region.valid_p():
+            xyz_region = self.region #if self.trans_region is None else self.trans_region
+            xmin, xmax, ymin, ymax = xyz_region.xmin, xyz_region.xmax, xyz_region.ymin, xyz_region.ymax
+            zmin, zmax = xyz_region.zmin, xyz_region.zmax
+            
         with warnings.catch_warnings():
             warnings.simplefilter('ignore')
             for points in self.yield_ds():
@@ -2127,24 +2491,31 @@ class ElevationDataset:
                     )
                     points = points[~np.isinf(points['z'])]
                     
-                if self.region is not None and self.region.valid_p():
-                    xyz_region = self.region.copy() #if self.trans_region is None else self.trans_region.copy()
+                if xyz_region is not None:
+                    ## build a single mask of the region, combining each test into it
+                    ## in place, and index the points once
                     if self.invert_region:
-                        points = points[((points['x'] > xyz_region.xmax) | (points['x'] < xyz_region.xmin)) | \
-                                        ((points['y'] > xyz_region.ymax) | (points['y'] < xyz_region.ymin))]
-                        if xyz_region.zmin is not None:
-                            points =  points[(points['z'] < xyz_region.zmin)]
-
-                        if xyz_region.zmax is not None:
-                            points =  points[(points['z'] > xyz_region.zmax)]
+                        region_mask = points['x'] > xmax
+                        region_mask |= points['x'] < xmin
+                        region_mask |= points['y'] > ymax
+                        region_mask |= points['y'] < ymin
+                        if zmin is not None:
+                            region_mask &= points['z'] < zmin
+
+                        if zmax is not None:
+                            region_mask &= points['z'] > zmax
                     else:
-                        points = points[((points['x'] < xyz_region.xmax) & (points['x'] > xyz_region.xmin)) & \
-                                        ((points['y'] < xyz_region.ymax) & (points['y'] > xyz_region.ymin))]
-                        if xyz_region.zmin is not None:
-                            points =  points[(points['z'] > xyz_region.zmin)]
+                        region_mask = points['x'] < xmax
+                        region_mask &= points['x'] > xmin
+                        region_mask &= points['y'] < ymax
+                        region_mask &= points['y'] > ymin
+                        if zmin is not None:
+                            region_mask &= points['z'] > zmin
 
-                        if xyz_region.zmax is not None:
-                            points =  points[(points['z'] < xyz_region.zmax)]
+                        if zmax is not None:
+                            region_mask &= points['z'] < zmax
+
+                    points = points[region_mask]
 
                 if len(points) > 0:
                     ## apply any dlim filters to the points
@@ -2200,8 +2571,8 @@ class ElevationDataset:
 
         return(dataset)
         
-    def yield_xyz(self):
-        """Yield the data as xyz points
+    def yield_xyz_batch(self):
+        """Yield the data as batches of x, y, z, w, u arrays
 
         incoming data are numpy rec-arrays of x,y,z<w,u> points.
 
@@ -2214,28 +2585,41 @@ class ElevationDataset:
         will be caluculated by `np.sqrt(u**2 + self.uncertainty**2)`
         """
         
-        count = 0
+        ## the dataset weight and uncertainty don't change from chunk to chunk;
+        ## datasets without per-point w/u (e.g. las) just get them filled in.
+        weight = self.weight if self.weight is not None else 1
+        uncertainty = self.uncertainty if self.uncertainty is not None else 0
         for points in self.yield_points():
-            try:
+            if 'w' in points.dtype.names:
                 points_w = points['w']
-            except:
-                points_w = np.ones(points['z'].shape)
-
-            points_w *= self.weight if self.weight is not None else 1
-            points_w[np.isnan(points_w)] = 1
+                points_w *= weight
+                points_w[np.isnan(points_w)] = 1
+            else:
+                points_w = np.full(points['z'].shape, weight, dtype=float)
                 
-            try:
-                points_u = points['u']
-            except:
-                points_u = np.zeros(points['z'].shape)
+            if 'u' in points.dtype.names:
+                points_u = np.sqrt(points['u']**2 + uncertainty**2)
+                points_u[np.isnan(points_u)] = 0
+            else:
+                points_u = np.full(points['z'].shape, abs(uncertainty), dtype=float)
 
-            points_u = np.sqrt(points_u**2 + (self.uncertainty if self.uncertainty is not None else 0)**2)
-            points_u[np.isnan(points_u)] = 0
-            dataset = np.vstack((points['x'], points['y'], points['z'], points_w, points_u)).transpose()
-            count += len(dataset)
-            points = None
-            for point in dataset:
-                this_xyz = xyzfun.XYZPoint(x=point[0], y=point[1], z=point[2], w=point[3], u=point[4])
+            yield(points['x'], points['y'], points['z'], points_w, points_u)
+        
+    def yield_xyz(self):
+        """Yield the data as xyz points
+
+        the points come from `self.yield_xyz_batch`, use that directly
+        when the data can be processed as arrays.
+        """
+        
+        ## the points are built straight from the batch arrays (as python floats),
+        ## rather than from the rows of a stacked copy of them
+        count = 0
+        for points_x, points_y, points_z, points_w, points_u in self.yield_xyz_batch():
+            count += len(points_z)
+            for x, y, z, w, u in zip(points_x.tolist(), points_y.tolist(), points_z.tolist(),
+                                     points_w.tolist(), points_u.tolist()):
+                this_xyz = xyzfun.XYZPoint(x=x, y=y, z=z, w=w, u=u)
                 yield(this_xyz)
 
         if self.verbose:
@@ -2261,10 +2645,13 @@ class ElevationDataset:
         
         out_arrays = {'z':None, 'count':None, 'weight':None, 'uncertainty': None, 'mask':None, 'x': None, 'y': None }
         count = 0
+        ## the output grid doesn't change from chunk to chunk, set it up once
+        xcount, ycount, dst_gt = self.region.geo_transform(
+            x_inc=self.x_inc, y_inc=self.y_inc, node='grid'
+        )
+        weight = self.weight if self.weight is not None else 1
+        uncertainty = self.uncertainty if self.uncertainty is not None else 0
         for points in self.yield_points():
-            xcount, ycount, dst_gt = self.region.geo_transform(
-                x_inc=self.x_inc, y_inc=self.y_inc, node='grid'
-            )
             ## convert the points to pixels based on the geotransform
             ## and calculate the local srcwin of the points
             pixel_x = np.floor((points['x'] - dst_gt[0]) / dst_gt[1]).astype(int)
@@ -2286,14 +2673,16 @@ class ElevationDataset:
                 pixel_u = np.zeros(pixel_z.shape)
                 
             ## remove pixels that will break the srcwin
-            out_idx = np.nonzero((pixel_x >= xcount) | (pixel_x < 0) | (pixel_y >= ycount) | (pixel_y < 0))
-            pixel_x = np.delete(pixel_x, out_idx)
-            pixel_y = np.delete(pixel_y, out_idx)
-            pixel_z = np.delete(pixel_z, out_idx)
-            pixel_w = np.delete(pixel_w, out_idx)
-            pixel_u = np.delete(pixel_u, out_idx)
-            points_x = np.delete(points_x, out_idx)
-            points_y = np.delete(points_y, out_idx)
+            in_msk = (pixel_x < xcount) & (pixel_x >= 0) & (pixel_y < ycount) & (pixel_y >= 0)
+            if not in_msk.all():
+                pixel_x = pixel_x[in_msk]
+                pixel_y = pixel_y[in_msk]
+                pixel_z = pixel_z[in_msk]
+                pixel_w = pixel_w[in_msk]
+                pixel_u = pixel_u[in_msk]
+                points_x = points_x[in_msk]
+                points_y = points_y[in_msk]
+                
             if len(pixel_x) == 0 or len(pixel_y) == 0:
                 continue
             
@@ -2307,72 +2696,62 @@ class ElevationDataset:
                            int(max(pixel_y) - min(pixel_y))+1)
             count += len(pixel_x)
 
-            ## adjust the pixels to the srcwin and stack together
+            ## adjust the pixels to the srcwin and flatten them to a cell index
             pixel_x = pixel_x - this_srcwin[0]
             pixel_y = pixel_y - this_srcwin[1]
-            pixel_xy = np.vstack((pixel_y, pixel_x)).T
+            pixel_idx = pixel_y * this_srcwin[2] + pixel_x
             
             ## find the non-unique x/y points and mean/min/max their z values together
-            ## while calculating the std for uncertainty
+            ## while calculating the std for uncertainty; the per-cell reductions are
+            ## done with bincount/reduceat over the unique cell index of each point.
             unq, unq_idx, unq_inv, unq_cnt = np.unique(
-                pixel_xy, axis=0, return_inverse=True, return_index=True, return_counts=True
+                pixel_idx, return_inverse=True, return_index=True, return_counts=True
             )
-            cnt_msk = unq_cnt > 1
-            cnt_idx, = np.nonzero(cnt_msk)
-            idx_msk = np.in1d(unq_inv, cnt_idx)
-            idx_idx, = np.nonzero(idx_msk)
-            srt_idx = np.argsort(unq_inv[idx_msk])
-            dup_idx = np.split(idx_idx[srt_idx], np.cumsum(unq_cnt[cnt_msk])[:-1])
-            zz = pixel_z[unq_idx]
+            unq_inv = unq_inv.reshape(-1)
+            unq_rows, unq_cols = np.divmod(unq, this_srcwin[2])
             ww = pixel_w[unq_idx]
             uu = pixel_u[unq_idx]
             xx = points_x[unq_idx]
             yy = points_y[unq_idx]
-            #u = np.zeros(zz.shape)
-            if np.any([len(dup) for dup in dup_idx]):
-                if self.stack_mode == 'min':
-                    dup_stack = [np.min(pixel_z[dup]) for dup in dup_idx]
-                    dup_stds = np.zeros(dup_stack.shape)
-                elif self.stack_mode == 'max':
-                    dup_stack = [np.max(pixel_z[dup]) for dup in dup_idx]
-                    dup_stds = np.zeros(dup_stack.shape)
-                else:
-                    dup_stack = [np.mean(pixel_z[dup]) for dup in dup_idx]
-                    dup_stack_x = [np.mean(points_x[dup]) for dup in dup_idx]
-                    dup_stack_y = [np.mean(points_y[dup]) for dup in dup_idx]
-                    dup_stds = [np.std(pixel_z[dup]) for dup in dup_idx]
-                    
-                zz[cnt_msk] = dup_stack
-                #uu[cnt_msk] = np.sqrt(dup_stds)
-                uu[cnt_msk] = np.sqrt(np.power(uu[cnt_msk],2) + np.power(dup_stds,2))
+            if len(unq) == len(pixel_idx):
+                zz = pixel_z[unq_idx]
+            elif self.stack_mode == 'min' or self.stack_mode == 'max':
+                ## group the points by cell and reduce each group
+                srt_idx = np.argsort(unq_inv, kind='stable')
+                grp_starts = np.concatenate(([0], np.cumsum(unq_cnt)[:-1]))
+                reduce_ufunc = np.minimum if self.stack_mode == 'min' else np.maximum
+                zz = reduce_ufunc.reduceat(pixel_z[srt_idx], grp_starts)
+            else:
+                zz = np.bincount(unq_inv, weights=pixel_z) / unq_cnt
+                z_dev = pixel_z - zz[unq_inv]
+                dup_stds = np.sqrt(np.bincount(unq_inv, weights=z_dev * z_dev) / unq_cnt)
+                uu = np.sqrt(np.power(uu, 2) + np.power(dup_stds, 2))
                 
-            ## make the output arrays to yield
-            out_x = np.zeros((this_srcwin[3], this_srcwin[2]))
-            out_x[unq[:,0], unq[:,1]] = xx
-            out_x[out_x == 0] = np.nan
+            ## make the output arrays to yield, cells without data are nan
+            out_x = np.full((this_srcwin[3], this_srcwin[2]), np.nan)
+            out_x[unq_rows, unq_cols] = xx
             out_arrays['x'] = out_x
 
-            out_y = np.zeros((this_srcwin[3], this_srcwin[2]))
-            out_y[unq[:,0], unq[:,1]] = yy
-            out_y[out_y == 0] = np.nan
+            out_y = np.full((this_srcwin[3], this_srcwin[2]), np.nan)
+            out_y[unq_rows, unq_cols] = yy
             out_arrays['y'] = out_y
             
-            out_z = np.zeros((this_srcwin[3], this_srcwin[2]))
-            out_z[unq[:,0], unq[:,1]] = zz
-            out_z[out_z == 0] = np.nan
+            out_z = np.full((this_srcwin[3], this_srcwin[2]), np.nan)
+            out_z[unq_rows, unq_cols] = zz
             out_arrays['z'] = out_z
             
             out_arrays['count'] = np.zeros((this_srcwin[3], this_srcwin[2]))
-            out_arrays['count'][unq[:,0], unq[:,1]] = unq_cnt
+            out_arrays['count'][unq_rows, unq_cols] = unq_cnt
             
-            out_arrays['weight'] = np.ones((this_srcwin[3], this_srcwin[2]))
-            out_arrays['weight'][:] = self.weight if self.weight is not None else 1
-            out_arrays['weight'][unq[:,0], unq[:,1]] *= ww #*unq_cnt
-            #out_arrays['weight'][unq[:,0], unq[:,1]] *= unq_cnt
+            out_arrays['weight'] = np.full(
+                (this_srcwin[3], this_srcwin[2]), weight, dtype=float
+            )
+            out_arrays['weight'][unq_rows, unq_cols] *= ww #*unq_cnt
+            #out_arrays['weight'][unq_rows, unq_cols] *= unq_cnt
             
             out_arrays['uncertainty'] = np.zeros((this_srcwin[3], this_srcwin[2]))
             #out_arrays['uncertainty'][:] = self.uncertainty if self.uncertainty is not None else 0
-            out_arrays['uncertainty'][unq[:,0], unq[:,1]] = np.sqrt(uu**2 + (self.uncertainty if self.uncertainty is not None else 0)**2)
+            out_arrays['uncertainty'][unq_rows, unq_cols] = np.sqrt(uu**2 + uncertainty**2)
 
             # ## apply any filters to the array
             # for f in self.stack_fltrs:
@@ -2617,11 +2996,12 @@ class XYZFile(ElevationDataset):
         self.x_offset = x_offset # offset x by x_offset
         self.y_offset = utils.int_or(y_offset, 0) # offset y by y_offset
         self.rem = False # x is 360 instead of 180
-        self.use_numpy = use_numpy # use numpy.loadtxt to load the xyz points
+        self.use_numpy = use_numpy # use the vectorized (pandas) parser to load the xyz points
         self.iter_rows = iter_rows # max rows to process at a time
+        self._delim_guessed = False # the delimiter is only sniffed once, see `guess_delim`
 
     def yield_ds(self):
-        if self.delim is not None:
+        if self.delim is not None and self.delim not in xyzfun._known_delims:
             xyzfun._known_delims.insert(0, self.delim)
                 
         if self.x_offset == 'REM':
@@ -2637,41 +3017,50 @@ class XYZFile(ElevationDataset):
                              if x is not None]
         self.field_formats = [float for x in [self.xpos, self.ypos, self.zpos, self.wpos, self.upos] if x is not None]
         #if self.use_numpy:
+        rows_done = 0 # the data rows already yielded from read_csv, the fallback resumes after them
         try:
-            if self.delim is None:
+            if self.delim is None and not self._delim_guessed:
                 self.guess_delim()
 
-            skip_ = self.skip            
-            with open(self.fn, 'r') as src_data:
-                while True:
-                    points = np.loadtxt(
-                        src_data,
-                        delimiter=self.delim,
-                        comments='#',
-                        ndmin = 1,
-                        skiprows=skip_,
-                        usecols=[x for x in [self.xpos, self.ypos, self.zpos, self.wpos, self.upos] if x is not None],
-                        dtype={'names': self.field_names, 'formats': self.field_formats},
-                        max_rows=self.iter_rows
+            ## parse the file in chunks of `iter_rows` with pandas' C parser,
+            ## yielding a rec-array of the selected columns for each chunk
+            field_cols = [x for x in [self.xpos, self.ypos, self.zpos, self.wpos, self.upos] if x is not None]
+            with pd.read_csv(
+                    self.fn,
+                    sep=r'\s+' if self.delim is None else self.delim,
+                    header=None,
+                    comment='#',
+                    skiprows=self.skip,
+                    usecols=field_cols,
+                    dtype=float,
+                    engine='c',
+                    memory_map=True,
+                    chunksize=utils.int_or(self.iter_rows, 1000000)
+            ) as src_chunks:
+                for chunk in src_chunks:
+                    rows_done += len(chunk)
+                    ## short or ragged rows come through as NaN, skip them as the
+                    ## line-by-line parser does
+                    chunk = chunk.dropna()
+                    points = np.rec.fromarrays(
+                        [chunk[col].to_numpy() for col in field_cols], names=self.field_names
                     )
-                    skip_ = 0
-
-                    if self.scoff:
-                        points['x'] = (points['x'] + self.x_offset) * self.x_scale
-                        points['y'] = (points['y'] + self.y_offset) * self.y_scale
-                        points['z'] *= self.z_scale
-
-                    if self.rem:
-                        points['x'] = np.fmod(points['x'] + 180, 360) - 180 
-                    
-                    yield(points)
-                    
-                    if self.iter_rows is None or len(points) < self.iter_rows:
-                        break
+                    yield(self._scale_offset(points))
 
-        ## old processing function used as a fallback for when numpy.loadtxt fails
+        ## old processing function used as a fallback for when pandas.read_csv fails
         except Exception as e:
             utils.echo_warning_msg('could not load xyz data from {}, {}, falling back'.format(self.fn, e))
+            ## files on disk are read in blocks through a memory map
+            if self.fn is not None and os.path.isfile(str(self.fn)) and os.path.getsize(self.fn) > 0:
+                for xyz_lines in self._mmap_xyz_lines():
+                    if rows_done > 0:
+                        xyz_lines, rows_done = self._skip_xyz_rows(xyz_lines, rows_done)
+                        
+                    if len(xyz_lines) > 0:
+                        yield(self._scale_offset(self._parse_xyz_lines(xyz_lines)))
+
+                return
+            
             if self.fn is not None:
                 if os.path.exists(str(self.fn)):
                     self.src_data = open(self.fn, "r")
@@ -2680,65 +3069,169 @@ class XYZFile(ElevationDataset):
             else:
                 self.src_data = sys.stdin
 
-            points_x = []
-            points_y = []
-            points_z = []
-            points_w = []
-            points_u = []
-            count = 0
+            ## parse the lines in blocks of `iter_rows`; see `_parse_xyz_lines`
+            iter_rows = utils.int_or(self.iter_rows, 1000000)
             skip = self.skip
+            xyz_lines = []
             for xyz_line in self.src_data:
-                if count >= skip:
-                    this_xyz = self.line_delim(xyz_line)
-                    if this_xyz is None:
-                        continue
-
-                    if len(this_xyz) < 3:
-                        continue
-                    
-                    x = utils.float_or(this_xyz[self.xpos])
-                    y = utils.float_or(this_xyz[self.ypos])
-                    z = utils.float_or(this_xyz[self.zpos])
-                    w = utils.float_or(this_xyz[self.wpos]) if self.wpos is not None else 1
-                    u = utils.float_or(this_xyz[self.upos]) if self.upos is not None else 0
-
-                    if x is None or y is None or z is None:
-                        continue
-                    
-                    if self.scoff:
-                        x = (x+self.x_offset) * self.x_scale
-                        y = (y+self.y_offset) * self.y_scale
-                        z *= self.z_scale
-
-                    if self.rem:
-                        x = math.fmod(x+180,360)-180 
-
-                    if self.data_region is not None and self.data_region.valid_p():
-                        try:
-                            this_xyz = xyzfun.XYZPoint(
-                                x=this_xyz[self.xpos], y=this_xyz[self.ypos], z=this_xyz[self.zpos]
-                            )
-                        except Exception as e:
-                            utils.echo_error_msg('{} ; {}'.format(e, this_xyz))
-                            this_xyz = xyzfun.XYZPoint()
-                            
-                    points_x.append(x)
-                    points_y.append(y)
-                    points_z.append(z)
-                    points_w.append(w)
-                    points_u.append(u)
-                    count += 1
-                else:
+                if skip > 0:
                     skip -= 1
+                    continue
+
+                ## skip the data rows already yielded from read_csv (see `_skip_xyz_rows`)
+                if rows_done > 0:
+                    if xyz_line.split('#', 1)[0].strip():
+                        rows_done -= 1
+                        
+                    continue
+                
+                xyz_lines.append(xyz_line)
+                if len(xyz_lines) >= iter_rows:
+                    yield(self._scale_offset(self._parse_xyz_lines(xyz_lines)))
+                    xyz_lines = []
 
             self.src_data.close()
-            dataset = np.column_stack((points_x, points_y, points_z, points_w, points_u))
-            points = np.rec.fromrecords(dataset, names='x, y, z, w, u')
+            if len(xyz_lines) > 0:
+                yield(self._scale_offset(self._parse_xyz_lines(xyz_lines)))
+
+    def _skip_xyz_rows(self, xyz_lines, n_rows):
+        """skip the first `n_rows` data rows of `xyz_lines`, counting rows as
+        read_csv does (lines with data before any '#' comment).
+
+        returns the remaining lines and the number of rows still to skip.
+        """
+
+        i = 0
+        while n_rows > 0 and i < len(xyz_lines):
+            if xyz_lines[i].split('#', 1)[0].strip():
+                n_rows -= 1
+
+            i += 1
+
+        return(xyz_lines[i:], n_rows)
+    
+    def _mmap_xyz_lines(self):
+        """memory map the xyz file and yield its lines (after `skip` lines)
+        in blocks of about `iter_rows` lines, split on whole lines.
+
+        the line boundaries are found in C on the mapped bytes, rather than
+        by iterating the file line-by-line.
+        """
+
+        block_size = max(utils.int_or(self.iter_rows, 1000000) * 32, 1024 * 1024)
+        with open(self.fn, 'rb') as src_xyz:
+            with mmap.mmap(src_xyz.fileno(), 0, access=mmap.ACCESS_READ) as src_mm:
+                mm_size = len(src_mm)
+                pos = 0
+                for _ in range(self.skip):
+                    pos = src_mm.find(b'\n', pos) + 1
+                    if pos == 0:
+                        return
+
+                while pos < mm_size:
+                    end = src_mm.find(b'\n', min(pos + block_size, mm_size - 1))
+                    end = mm_size if end == -1 else end + 1
+                    yield(src_mm[pos:end].decode('utf-8', errors='ignore').splitlines(True))
+                    pos = end
+
+    def _parse_xyz_lines(self, xyz_lines):
+        """parse a block of xyz lines into an x, y, z, w, u rec-array.
+
+        A regular block (the same number of numeric fields on every line)
+        is parsed in one pass in C by `np.loadtxt`, which rejects ragged or
+        non-numeric lines; those blocks fall back to parsing the block
+        line-by-line, skipping invalid lines.
+        """
+
+        xpos, ypos, zpos, wpos, upos = self.xpos, self.ypos, self.zpos, self.wpos, self.upos
+        max_pos = max(x for x in [xpos, ypos, zpos, wpos, upos] if x is not None)
+        xyz_text = ''.join(xyz_lines)
+        if self.delim is not None:
+            xyz_text = xyz_text.replace(self.delim, ' ')
+
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                xyz_array = np.loadtxt(io.StringIO(xyz_text), dtype=float, comments='#', ndmin=2)
+        except ValueError:
+            xyz_array = None
+
+        xyz_text = None
+        if xyz_array is not None and len(xyz_array) > 0 \
+           and xyz_array.shape[1] >= 3 and max_pos < xyz_array.shape[1]:
+            return(np.rec.fromarrays(
+                [xyz_array[:, xpos], xyz_array[:, ypos], xyz_array[:, zpos],
+                 xyz_array[:, wpos] if wpos is not None else np.ones(len(xyz_array)),
+                 xyz_array[:, upos] if upos is not None else np.zeros(len(xyz_array))],
+                names='x, y, z, w, u', formats=['f8'] * 5
+            ))
+
+        points_x = []
+        points_y = []
+        points_z = []
+        points_w = []
+        points_u = []
+        ## hoist the attribute and method lookups out of the per-line loop;
+        ## scale/offset is applied to the whole array afterwards.
+        ## lines are split with the delimiter found by `guess_delim` (None splits
+        ## on runs of whitespace), only lines that don't split with it go through
+        ## `line_delim` to guess their own delimiter.
+        delim = self.delim
+        line_delim = self.line_delim
+        float_or = utils.float_or
+        for xyz_line in xyz_lines:
+            this_xyz = xyz_line.split(delim)
+            if len(this_xyz) < 2:
+                this_xyz = line_delim(xyz_line)
+                
+            if this_xyz is None:
+                continue
+
+            if len(this_xyz) < 3:
+                continue
+
+            x = float_or(this_xyz[xpos])
+            y = float_or(this_xyz[ypos])
+            z = float_or(this_xyz[zpos])
+            if x is None or y is None or z is None:
+                continue
+
+            points_x.append(x)
+            points_y.append(y)
+            points_z.append(z)
+            points_w.append(float_or(this_xyz[wpos]) if wpos is not None else 1)
+            points_u.append(float_or(this_xyz[upos]) if upos is not None else 0)
+
+        return(np.rec.fromarrays(
+            [points_x, points_y, points_z, points_w, points_u], names='x, y, z, w, u', formats=['f8'] * 5
+        ))
+        
+    def _scale_offset(self, points):
+        """apply the scale/offset and REM adjustments to the `points` in place,
+        skipping any scale of 1 or offset of 0.
+        """
+
+        if self.scoff:
+            for key, offset, scale in [('x', self.x_offset, self.x_scale),
+                                       ('y', self.y_offset, self.y_scale),
+                                       ('z', 0, self.z_scale)]:
+                if offset != 0:
+                    points[key] += offset
+
+                if scale != 1:
+                    points[key] *= scale
+
+        if self.rem:
+            points['x'] += 180
+            np.fmod(points['x'], 360, out=points['x'])
+            points['x'] -= 180
             
-            yield(points)
+        return(points)
         
     def guess_delim(self):
-        """guess the xyz delimiter"""
+        """guess the xyz delimiter from the first data line (after `skip` lines,
+        comments and blank lines)
+        """
 
         if self.fn is not None:
             if os.path.exists(str(self.fn)):
@@ -2748,7 +3241,16 @@ class XYZFile(ElevationDataset):
         else:
             self.src_data = sys.stdin
 
+        self._delim_guessed = True
+        skip = self.skip
         for xyz_line in self.src_data:
+            if skip > 0:
+                skip -= 1
+                continue
+
+            if xyz_line.startswith('#') or xyz_line.strip() == '':
+                continue
+            
             for delim in xyzfun._known_delims:
                 try:
                     this_xyz = xyz_line.split(delim)
@@ -2798,6 +3300,9 @@ class LASFile(ElevationDataset):
     def __init__(self, classes='2/29/40', **kwargs):
         super().__init__(**kwargs)
         self.classes = [int(x) for x in classes.split('/')] # list of lidar classes to retain
+        ## las classifications are uint8, so look them up in a table rather than with np.isin
+        self._class_lut = np.zeros(256, dtype=bool)
+        self._class_lut[[c for c in self.classes if 0 <= c < 256]] = True
         if self.src_srs is None:
             self.src_srs = self.get_epsg()
             if self.src_srs is None:
@@ -2809,14 +3314,11 @@ class LASFile(ElevationDataset):
         if self.fn is None: # and not self.fn.startswith('http'):
             return(False)
         else:
-            if os.path.exists(self.fn) :
-                if os.stat(self.fn).st_size == 0:
-                    return(False)
-            else:
+            if not self.fn_stat_p():
                 return(False)
 
             try:
-                lp.open(self.fn)
+                _laspy().open(self.fn)
             except:
                 utils.echo_warning_msg('{} could not be opened by the lasreader'.format(self.fn))
                 return(False)
@@ -2824,6 +3326,7 @@ class LASFile(ElevationDataset):
         return(True)
         
     def get_epsg(self):
+        lp = _laspy()
         with lp.open(self.fn) as lasf:
             lasf_vlrs = lasf.header.vlrs
             for vlr in lasf_vlrs:
@@ -2834,7 +3337,8 @@ class LASFile(ElevationDataset):
 
     def generate_inf(self):
         """generate an inf file for a lidar dataset."""
-        
+
+        lp = _laspy()
         with lp.open(self.fn) as lasf:
             self.infos.numpts = lasf.header.point_count
             this_region = regions.Region(xmin=lasf.header.x_min, xmax=lasf.header.x_max,
@@ -2846,17 +3350,37 @@ class LASFile(ElevationDataset):
         self.infos.src_srs = self.src_srs if self.src_srs is not None else self.get_epsg()            
         return(self.infos)
 
-    def yield_ds(self):
+    def _read_chunks(self, chunk_size=2_000_000):
+        """read and classify the las points in chunks of `chunk_size` and yield
+        the resulting rec-arrays.
+        """
+
+        lp = _laspy()
         with lp.open(self.fn) as lasf:
-            try:
-                for points in lasf.chunk_iterator(2_000_000):
-                    points = points[(np.isin(points.classification, self.classes))]
-                    dataset = np.column_stack((points.x, points.y, points.z))
-                    points = np.rec.fromrecords(dataset, names='x, y, z')                    
-                    yield(points)
+            for points in lasf.chunk_iterator(chunk_size):
+                points = points[self._class_lut[np.asarray(points.classification)]]
+                ## fill the x, y, z fields of the rec-array directly from the
+                ## scaled las coordinates, without an intermediate (N,3) array
+                points = np.rec.fromarrays(
+                    [np.asarray(points.x), np.asarray(points.y), np.asarray(points.z)], names='x, y, z'
+                )
+                yield(points)
+        
+    def yield_ds(self):
+        """yield the classified las points, the next chunk is read in a background
+        thread while the current chunk is processed downstream.
+        """
+        
+        las_chunks = utils.yield_from_thread(self._read_chunks)
+        try:
+            for points in las_chunks:
+                yield(points)
                     
-            except Exception as e:
-                utils.echo_warning_msg('could not read points from lasfile {}, {}'.format(self.fn, e))
+        except Exception as e:
+            utils.echo_warning_msg('could not read points from lasfile {}, {}'.format(self.fn, e))
+        finally:
+            ## let the reader finish (and close the las file) before returning
+            las_chunks.close()
                 
 class GDALFile(ElevationDataset):
     """providing a GDAL raster dataset parser.
@@ -2999,6 +3523,15 @@ class GDALFile(ElevationDataset):
             
         return(srcwin)
         
+    def _read_blocks(self, blocks, block_bands):
+        """read each block (x_off, y_off, x_size, y_size) in `blocks` from each of
+        the `block_bands` and yield the block and its arrays.
+        """
+
+        for block in blocks:
+            arrs = {key: this_band.ReadAsArray(*block) for key, this_band in block_bands.items()}
+            yield((block, arrs))
+        
     def yield_ds(self):
         """initialize the raster dataset
 
@@ -3017,9 +3550,14 @@ class GDALFile(ElevationDataset):
             self.open_options = None
             
         ## set up any transformations and other options
-        inf_region = regions.Region().from_string(self.infos.wkt)
         self.sample_alg = self.sample if self.sample is not None else self.sample_alg
         self.dem_infos = gdalfun.gdal_infos(self.fn)
+        inf_region = self.inf_region()
+        if inf_region is None:
+            inf_region = regions.Region().from_geo_transform(
+                self.dem_infos['geoT'], self.dem_infos['nx'], self.dem_infos['ny']
+            )
+            
         if self.node is None:
             self.node = gdalfun.gdal_get_node(self.fn, 'pixel')
             
@@ -3245,9 +3783,6 @@ class GDALFile(ElevationDataset):
         mask_band = None
         weight_band = None
         uncertainty_band = None
-        nodata = ['{:g}'.format(-9999), 'nan', float('nan')]            
-        if ndv is not None:
-            nodata.append('{:g}'.format(ndv))
 
         band_data = count_data = weight_data = mask_data = None
                 
@@ -3327,86 +3862,109 @@ class GDALFile(ElevationDataset):
             else:
                 uncertainty_band = trans_uncertainty.GetRasterBand(1)
 
-        ## parse through the data
+        ## parse through the data, a block at a time; use the band's natural
+        ## block size (at least 512x512) so tiled rasters are read on block
+        ## boundaries and memory is capped at a block rather than the srcwin.
         srcwin = self.get_srcwin(gt, self.src_ds.RasterXSize, self.src_ds.RasterYSize, node=self.node)
-        for y in range(srcwin[1], (srcwin[1] + srcwin[3]), 1):
-            band_data = band.ReadAsArray(srcwin[0], y, srcwin[2], 1).astype(float)
-            if ndv is not None and not np.isnan(ndv):
-                band_data[band_data == ndv] = np.nan
-
-            if np.all(np.isnan(band_data)):
-                continue
+        block_xsize, block_ysize = band.GetBlockSize()
+        block_xsize = max(block_xsize, 512)
+        block_ysize = max(block_ysize, 512)
+        if block_xsize * block_ysize > 4194304:
+            ## scan-line blocks, read full-width strips of as many rows as fit
+            block_ysize = max(1, 4194304 // block_xsize)
+
+        x_end = srcwin[0] + srcwin[2]
+        y_end = srcwin[1] + srcwin[3]
+        blocks = []
+        for y0 in range(srcwin[1] - (srcwin[1] % block_ysize), y_end, block_ysize):
+            y_off = max(y0, srcwin[1])
+            y_size = min(y0 + block_ysize, y_end) - y_off
+            for x0 in range(srcwin[0] - (srcwin[0] % block_xsize), x_end, block_xsize):
+                x_off = max(x0, srcwin[0])
+                blocks.append((x_off, y_off, min(x0 + block_xsize, x_end) - x_off, y_size))
+
+        ## the blocks are read ahead in a background thread (gdal releases the GIL
+        ## while reading) and processed here as they arrive
+        block_bands = {'z': band}
+        if weight_band is not None:
+            block_bands['w'] = weight_band
+
+        if uncertainty_band is not None:
+            block_bands['u'] = uncertainty_band
+
+        if self.x_band is not None and self.y_band is not None:
+            block_bands['x'] = self.src_ds.GetRasterBand(self.x_band)
+            block_bands['y'] = self.src_ds.GetRasterBand(self.y_band)
+            
+        ## only the reader thread touches the bands once it starts
+        weight_ndv = utils.float_or(weight_band.GetNoDataValue()) if weight_band is not None else None
+        uncertainty_ndv = utils.float_or(uncertainty_band.GetNoDataValue()) if uncertainty_band is not None else None
+        data_dtype = None
+        ## the next block is read in a background thread while the current block is processed
+        block_arrays = utils.yield_from_thread(lambda: self._read_blocks(blocks, block_bands))
+        try:
+            for (x_off, y_off, x_size, y_size), arrs in block_arrays:
+                ## keep single precision data (float32/int16/byte) in float32, which halves
+                ## the memory moved by the masking below; int32/float64 still go to float64
+                band_data = arrs['z']
+                if data_dtype is None:
+                    data_dtype = np.result_type(band_data.dtype, np.float32)
+                    ## the nodata values as scalars of the block dtype, set once; a nan
+                    ## (or missing) nodata value is caught by the isnan test instead
+                    band_ndv, weight_ndv, uncertainty_ndv = [
+                        None if x is None or np.isnan(x) else data_dtype.type(x) \
+                        for x in (ndv, weight_ndv, uncertainty_ndv)
+                    ]
+                    
+                band_data = band_data.astype(data_dtype, copy=False)
+                if band_ndv is not None:
+                    band_data[band_data == band_ndv] = np.nan
 
-            ## weights
-            if weight_band is not None:
-                weight_data = weight_band.ReadAsArray(srcwin[0], y, srcwin[2], 1)
-                weight_ndv = float(weight_band.GetNoDataValue())
-                if not np.isnan(weight_ndv):
-                    weight_data[weight_data==weight_ndv] = np.nan
-            else:
-                weight_data = np.ones(band_data.shape)
+                valid = ~np.isnan(band_data)
+                if not np.any(valid):
+                    continue
 
-            ## uncertainty
-            if uncertainty_band is not None:
-                uncertainty_data = uncertainty_band.ReadAsArray(srcwin[0], y, srcwin[2], 1)
-                uncertainty_ndv = float(uncertainty_band.GetNoDataValue())
-                if not np.isnan(uncertainty_ndv):
-                    uncertainty_data[uncertainty_data==uncertainty_ndv] = np.nan
+                ## weights
+                if weight_band is not None:
+                    weight_data = arrs['w'].astype(data_dtype)
+                    if weight_ndv is not None:
+                        weight_data[weight_data==weight_ndv] = np.nan
+                else:
+                    weight_data = np.ones(band_data.shape, dtype=data_dtype)
 
-                if self.trans_fn_unc is None:
-                    uncertainty_data *= self.uncertainty_mask_to_meter
-                    
-            else:
-                uncertainty_data = np.zeros(band_data.shape)
-
-            ## convert grid array to points
-            if self.x_band is None and self.y_band is None:
-                x_precision = 12#len(str(gt[0]).split('.')[-1])
-                y_precision = 12#len(str(gt[3]).split('.')[-1])
-                while True:
-                    geo_x_origin, geo_y_origin = utils._pixel2geo(
-                        srcwin[0], y, gt, node=self.node, x_precision=x_precision, y_precision=y_precision
-                    )
-                    geo_x_end, geo_y_end = utils._pixel2geo(
-                        srcwin[0] + srcwin[2], y, gt, node='grid', x_precision=x_precision, y_precision=y_precision
-                    )
-                    lon_array = np.arange(geo_x_origin, geo_x_end, gt[1])
+                ## uncertainty
+                if uncertainty_band is not None:
+                    uncertainty_data = arrs['u'].astype(data_dtype)
+                    if uncertainty_ndv is not None:
+                        uncertainty_data[uncertainty_data==uncertainty_ndv] = np.nan
 
-                    if lon_array.shape == band_data[0].shape:
-                        break
-                    else:
-                        if x_precision < 0 or y_precision < 0:
-                            break
+                    if self.trans_fn_unc is None:
+                        uncertainty_data *= self.uncertainty_mask_to_meter
 
-                        x_precision -= 1
-                        y_precision -= 1
+                else:
+                    uncertainty_data = np.zeros(band_data.shape, dtype=data_dtype)
 
-                lat_array = np.zeros((lon_array.shape))
-                lat_array[:] = geo_y_origin
-                dataset = np.column_stack((lon_array, lat_array, band_data[0], weight_data[0], uncertainty_data[0]))
+                ## convert grid array to points
+                if self.x_band is None or self.y_band is None:
+                    pix_y, pix_x = np.nonzero(valid)
+                    lon_array, lat_array = utils._apply_gt(
+                        pix_x + x_off, pix_y + y_off, gt, node=self.node
+                    )
+                else:
+                    lon_array = arrs['x'].astype(float)[valid]
+                    lat_array = arrs['y'].astype(float)[valid]
 
-                try:
-                    assert lon_array.shape == lat_array.shape
-                    assert lon_array.shape == band_data[0].shape
-                    dataset = np.column_stack((lon_array, lat_array, band_data[0], weight_data[0], uncertainty_data[0]))
-                except Exception as e:
-                    utils.echo_error_msg(e)
-                    pass
-            else:
-                lon_band = self.src_ds.GetRasterBand(self.x_band)
-                lon_array = lon_band.ReadAsArray(srcwin[0], y, srcwin[2], 1).astype(float)
-                lon_array[np.isnan(band_data)] = np.nan
-
-                lat_band = self.src_ds.GetRasterBand(self.y_band)
-                lat_array = lat_band.ReadAsArray(srcwin[0], y, srcwin[2], 1).astype(float)
-                lat_array[np.isnan(band_data)] = np.nan
-                dataset = np.column_stack((lon_array[0], lat_array[0], band_data[0], weight_data[0], uncertainty_data[0]))
-
-            points = np.rec.fromrecords(dataset, names='x, y, z, w, u')
-            points =  points[~np.isnan(points['z'])]
-            dataset = band_data = weight_data = uncertainty_data = lat_array = lon_array = None
+                points = np.rec.fromarrays(
+                    [lon_array, lat_array, band_data[valid], weight_data[valid], uncertainty_data[valid]],
+                    names='x, y, z, w, u'
+                )
+                band_data = weight_data = uncertainty_data = lat_array = lon_array = valid = arrs = None
+                yield(points)
+                
+        finally:
+            ## let the reader finish before the datasets and temp rasters are released
+            block_arrays.close()
             utils.remove_glob(tmp_elev_fn, tmp_unc_fn, tmp_weight_fn)
-            yield(points)
             
         src_uncertainty = src_weight = trans_uncertainty = self.src_ds = None
         
@@ -3481,6 +4039,38 @@ class BAGFile(ElevationDataset):
         self.infos.numpts = ds_infos['nb']
         return(self.infos)
 
+    def _read_ds_points(self):
+        """yield the points from each of the exploded BAG datasets, one dataset
+        after another.
+        """
+
+        for this_ds in self.parse():
+            for points in this_ds.yield_ds():
+                yield(points)
+    
+    def yield_ds(self):
+        """yield the points from the BAG datasets.
+
+        when exploded, the supergrids are read in a background thread while the
+        current points are processed downstream; the supergrids are read one at
+        a time (the BAG is only ever accessed from one thread) and in order.
+        """
+
+        if not self.explode:
+            for points in super().yield_ds():
+                yield(points)
+                
+            return
+        
+        ds_points = utils.yield_from_thread(self._read_ds_points)
+        try:
+            for points in ds_points:
+                yield(points)
+                
+        finally:
+            ## let the reader finish before returning
+            ds_points.close()
+                
     def parse(self, resample=True):
         mt = gdal.Info(self.fn, format='json')['metadata']['']
         oo = []
@@ -3541,6 +4131,7 @@ class BAGFile(ElevationDataset):
                 for gdal_ds in sub_ds.parse():
                     yield(gdal_ds)
             else: # use vrbag.py
+                from cudem import vrbag
                 tmp_bag_as_tif = utils.make_temp_fn('{}_tmp.tif'.format(utils.fn_basename2(self.fn)))
                 #self.x_inc * 111120 # scale cellsize to meters, todo: check if input is degress/meters/feet
                 sr_cell_size = None
@@ -3590,6 +4181,7 @@ class SWOTFile(ElevationDataset):
         super().__init__(**kwargs)
         
     def _init_h5File(self, short_name='L2_HR_PIXC'):
+        import h5py as h5
         src_h5 = None
         try:
             src_h5 = h5.File(self.fn, 'r')
@@ -3676,34 +4268,35 @@ class SWOT_PIXC(SWOTFile):
             else:
                 out_data = var_data
                 
-            dataset = np.column_stack((longitude, latitude, out_data))
-            points = np.rec.fromrecords(dataset, names='x, y, z')
+            points = np.rec.fromarrays([longitude, latitude, out_data], names='x, y, z', formats=['f8'] * 3)
             #points = points[points['z'] != 9.96921e+36]
 
+            ## build one mask from the fill value and the (ancilliary) classification
+            ## filters, all of which index the full (unfiltered) swath, and apply it once
+            points_mask = points['z'] != -9.969209968386869e+36
+            
             ## Classification Filter
             if len(self.classes) > 0:
                 class_data = self._get_var_arr(src_h5, '{}/classification'.format(self.group))
-                points = points[(np.isin(class_data, self.classes))]
+                points_mask &= np.isin(class_data, self.classes)
 
                 ## Classification Quality Filter
                 if self.remove_class_flags:
                     class_qual_data = self._get_var_arr(src_h5, '{}/classification_qual'.format(self.group))
-                    class_qual_data = class_qual_data[(np.isin(class_data, self.classes))]
-                    points = points[class_qual_data == 0]
+                    points_mask &= class_qual_data == 0
                                    
                 elif len(self.classes_qual) > 0:
                     class_qual_data = self._get_var_arr(src_h5, '{}/classification_qual'.format(self.group))
-                    class_qual_data = class_qual_data[(np.isin(class_data, self.classes))]
-                    points = points[(~np.isin(class_qual_data, self.classes_qual))]
+                    points_mask &= ~np.isin(class_qual_data, self.classes_qual)
                 
             ## Ancilliary Classification Filter
             if len(self.anc_classes) > 0:
                 anc_class_data = self._get_var_arr(
                     src_h5, '{}/ancillary_surface_classification_flag'.format(self.group)
                 )
-                points = points[(np.isin(anc_class_data, self.anc_classes))]
+                points_mask &= np.isin(anc_class_data, self.anc_classes)
                 
-            points = points[points['z'] != -9.969209968386869e+36]
+            points = points[points_mask]
             self._close_h5File(src_h5)
             self._close_h5File(src_h5_vec)
 
@@ -3830,6 +4423,7 @@ class IceSat2File(ElevationDataset):
     def init_atl_h5(self):
         """initialize the atl03 and atl08 h5 files"""
 
+        import h5py as h5
         self.atl_03_f = None
         self.atl_08_f = None
         self.atl_03_f = h5.File(self.atl_03_fn, 'r')
@@ -4135,6 +4729,7 @@ class IceSat2File(ElevationDataset):
         This function is adapted from the C-Shelph CLI
         """
         
+        from cudem import cshelph
         water_temp = utils.float_or(water_temp)
         epsg_code = cshelph.convert_wgs_to_utm(dataset.latitude.iloc[0], dataset.longitude.iloc[0])
         epsg_num = int(epsg_code.split(':')[-1])
@@ -4336,6 +4931,12 @@ class MBSParser(ElevationDataset):
         self.mb_exclude = mb_exclude
         self.want_mbgrid = want_mbgrid
         self.want_binned = want_binned
+        self._mbgrid_fn = None # cached mbgrid output, see _materialize_grid
+        self._mbgrid_key = None
+        self._mbgrid_users = 0 # passes currently reading the cached mbgrid output
+
+    def __del__(self):
+        self._remove_mbgrid()
              
     def inf_parse(self):
         self.infos.minmax = [0,0,0,0,0,0]
@@ -4377,8 +4978,8 @@ class MBSParser(ElevationDataset):
                             cm_array = np.zeros((dims[0], dims[1]))
                             
                     if til[0] == 'CM:':
-                        for j in range(0, dims[0]):
-                            cm_array[this_row][j] = utils.int_or(til[j+1])
+                        ## convert the whole coverage-mask row at once
+                        cm_array[this_row, :dims[0]] = np.array(til[1:dims[0]+1]).astype(int)
                         this_row += 1
 
         mbs_region = regions.Region().from_list(self.infos.minmax)
@@ -4453,11 +5054,39 @@ class MBSParser(ElevationDataset):
 
         utils.remove_glob('{}*'.format(out_mb))
 
-    def yield_mbgrid_ds(self):
-        """process the data through mbgrid and use GDALFile to further process the gridded data"""
+    def _remove_mbgrid(self):
+        """remove the cached mbgrid output (and its sidecar files), if any"""
+
+        mbgrid_fn = getattr(self, '_mbgrid_fn', None)
+        if mbgrid_fn is not None:
+            utils.remove_glob('{}*'.format(mbgrid_fn))
+            
+        self._mbgrid_fn = None
+        self._mbgrid_key = None
         
+    def _materialize_grid(self):
+        """run the data through mbgrid and return the resulting gdal file.
+
+        the grid is cached on the dataset and keyed on the region and
+        increments, so repeated passes (e.g. yield_xyz then yield_array)
+        re-use the same mbgrid output instead of re-running mbgrid.
+        the grid is removed with the dataset, see `_remove_mbgrid`.
+        """
+
+        grid_key = (self.data_region.format('gmt'), self.x_inc, self.y_inc)
+        if self._mbgrid_key == grid_key \
+           and self._mbgrid_fn is not None \
+           and os.path.exists(self._mbgrid_fn):
+            return(self._mbgrid_fn)
+
+        ## a grid for another region/increment is no longer needed
+        self._remove_mbgrid()
         mb_fn = os.path.join(self.fn)
-        with open('_mb_grid_tmp.datalist', 'w') as tmp_dl:
+        ofn = os.path.join(
+            self.cache_dir, '_'.join(os.path.basename(mb_fn).split('.')[:-1])
+        )
+        mb_dl = '{}_mb_grid_tmp.datalist'.format(ofn)
+        with open(mb_dl, 'w') as tmp_dl:
             tmp_dl.write(
                 '{} {} {}\n'.format(
                     self.fn,
@@ -4466,34 +5095,47 @@ class MBSParser(ElevationDataset):
                 )
             )
 
-        ofn = '_'.join(os.path.basename(mb_fn).split('.')[:-1])
-        try:
-            utils.run_cmd(
-                'mbgrid -I_mb_grid_tmp.datalist {} -E{}/{}/degrees! -O{} -A2 -F1 -C10/1 -S0 -T35'.format(
-                    self.data_region.format('gmt'), self.x_inc, self.y_inc, ofn
-                ), verbose=True
-            )
+        utils.run_cmd(
+            'mbgrid -I{} {} -E{}/{}/degrees! -O{} -A2 -F1 -C10/1 -S0 -T35'.format(
+                mb_dl, self.data_region.format('gmt'), self.x_inc, self.y_inc, ofn
+            ), verbose=True
+        )
 
-            gdalfun.gdal2gdal('{}.grd'.format(ofn))
-            utils.remove_glob(
-                '_mb_grid_tmp.datalist',
-                '{}.cmd'.format(ofn),
-                '{}.mb-1'.format(ofn),
-                '{}.grd*'.format(ofn)
-            )
+        ## gdal reads mbgrid's grd directly, so skip the round-trip through
+        ## a compressed GeoTIFF
+        mbgrid_fn = '{}.grd'.format(ofn)
+        self._mbgrid_fn = mbgrid_fn if os.path.exists(mbgrid_fn) else None
+        self._mbgrid_key = grid_key if self._mbgrid_fn is not None else None
+        utils.remove_glob(
+            mb_dl,
+            '{}.cmd'.format(ofn),
+            '{}.mb-1'.format(ofn)
+        )
+        return(self._mbgrid_fn)
+    
+    def yield_mbgrid_ds(self):
+        """process the data through mbgrid and use GDALFile to further process the gridded data"""
+
+        mbgrid_fn = self._materialize_grid()
+        if mbgrid_fn is None:
+            return
+
+        ## the grid is shared by the passes running at the same time,
+        ## the last one to finish removes it.
+        self._mbgrid_users += 1
+        try:
             mbs_ds = DatasetFactory(
-                **self._set_params(mod='{}.tif'.format(ofn), data_format=200)
+                **self._set_params(mod=mbgrid_fn, data_format=200)
             )
             mbs_ds.initialize()
             for gdal_ds in mbs_ds.parse():
                 for pts in gdal_ds.yield_points():
                     yield(pts)
-            
-            #yield(mbs_ds)
-            utils.remove_glob('{}.tif*'.format(ofn))
-        except Exception as e:
-            #pass
-            raise(e)
+                    
+        finally:
+            self._mbgrid_users -= 1
+            if self._mbgrid_users == 0:
+                self._remove_mbgrid()
 
     def yield_mblist_ds(self):
         """use mblist to process the multibeam data"""
@@ -4548,9 +5190,8 @@ class MBSParser(ElevationDataset):
                 us.append(u)
 
         if len(xs) > 0:
-            mb_points = np.column_stack((xs, ys, zs, ws, us))
+            mb_points = np.rec.fromarrays([xs, ys, zs, ws, us], names='x, y, z, w, u', formats=['f8'] * 5)
             xs = ys = zs = ws = us = None
-            mb_points = np.rec.fromrecords(mb_points, names='x, y, z, w, u')
 
             if self.want_binned:
                 point_filter = PointFilterFactory(
@@ -4683,7 +5324,7 @@ class OGRFile(ElevationDataset):
 
                 for f in layer_s:
                     geom = f.GetGeometryRef()
-                    g = json.loads(geom.ExportToJson())
+                    g = orjson.loads(geom.ExportToJson()) if has_orjson else json.loads(geom.ExportToJson())
                     #utils.echo_msg(g)
                     xyzs = g['coordinates']
                     if not geom.GetGeometryName() == 'MULTIPOINT':
@@ -5032,62 +5673,24 @@ class Datalist(ElevationDataset):
                     ),
                     leave=self.verbose
             ) as pbar:
-                for l,feat in enumerate(dl_layer):
-                    pbar.update()
-                    ## filter by input source region extras (weight/uncertainty)
-                    if self.region is not None:
-                        w_region = self.region.w_region()
-                        if w_region[0] is not None:
-                            if float(feat.GetField('weight')) < w_region[0]:
-                                continue
-
-                        if w_region[1] is not None:
-                            if float(feat.GetField('weight')) > w_region[1]:
-                                continue
-
-                        u_region = self.region.u_region()
-                        if u_region[0] is not None:
-                            if float(feat.GetField('uncertainty')) < u_region[0]:
-                                continue
-
-                        if u_region[1] is not None:
-                            if float(feat.GetField('uncertainty')) > u_region[1]:
-                                continue
+                ## the datasets are acquired ahead in a background thread while the
+                ## current dataset is being initialized and parsed
+                json_datasets = utils.yield_from_thread(
+                    lambda: self._read_json_datasets(dl_layer), maxsize=4
+                )
+                try:
+                    for data_set in json_datasets:
+                        pbar.update()
+                        if data_set is None:
+                            continue
 
-                    ## extract the module arguments from the datalist-vector
-                    try:
-                        ds_args = feat.GetField('mod_args')
-                        data_set_args = utils.args2dict(list(ds_args.split(':')), {})
-                        for kpam, kval in data_set_args.items():
-                            if kpam in self.__dict__:
-                                self.__dict__[kpam] = kval
-                                del data_set_args[kpam]
-                    except:
-                        data_set_args = {}
-
-                    ## update existing metadata
-                    md = copy.deepcopy(self.metadata)
-                    for key in self.metadata.keys():
-                        md[key] = feat.GetField(key)
-
-                    ## generate the dataset object to yield
-                    data_mod = '"{}" {} {} {}'.format(
-                        feat.GetField('path'),
-                        feat.GetField('format'),
-                        feat.GetField('weight'),
-                        feat.GetField('uncertainty')
-                    )
-                    data_set = DatasetFactory(
-                        **self._set_params(mod=data_mod, metadata=md, **data_set_args)
-                    )._acquire_module()
-                    if data_set is not None and data_set.valid_p(
-                            fmts=DatasetFactory._modules[data_set.data_format]['fmts']
-                    ):
                         data_set.initialize()
                         ## fill self.data_entries with each dataset for use outside the yield.
                         for ds in data_set.parse(): 
                             self.data_entries.append(ds) 
                             yield(ds)
+                finally:
+                    json_datasets.close()
 
             dl_ds = dl_layer = None
                 
@@ -5100,6 +5703,59 @@ class Datalist(ElevationDataset):
             for ds in self.parse_no_json():
                 yield(ds)
                                         
+    def _read_json_datasets(self, dl_layer):
+        """acquire the dataset of each feature in the datalist-vector `dl_layer`
+        and yield it, or None for a feature that is filtered out or invalid.
+
+        the datasets are only acquired here, they are initialized and parsed
+        by the consumer, in order; nothing here modifies `self`.
+        """
+
+        for feat in dl_layer:
+            ## filter by input source region extras (weight/uncertainty)
+            if self.region is not None:
+                w_region = self.region.w_region()
+                u_region = self.region.u_region()
+                feat_w = float(feat.GetField('weight')) if w_region[0] is not None or w_region[1] is not None else None
+                feat_u = float(feat.GetField('uncertainty')) if u_region[0] is not None or u_region[1] is not None else None
+                if (w_region[0] is not None and feat_w < w_region[0]) \
+                   or (w_region[1] is not None and feat_w > w_region[1]) \
+                   or (u_region[0] is not None and feat_u < u_region[0]) \
+                   or (u_region[1] is not None and feat_u > u_region[1]):
+                    yield(None)
+                    continue
+
+            ## extract the module arguments from the datalist-vector, they are
+            ## passed on to the dataset (see `_set_params`), not set on `self`
+            try:
+                ds_args = feat.GetField('mod_args')
+                data_set_args = utils.args2dict(list(ds_args.split(':')), {})
+            except:
+                data_set_args = {}
+
+            ## update existing metadata
+            md = dict(self.metadata)
+            for key in self.metadata.keys():
+                md[key] = feat.GetField(key)
+
+            ## generate the dataset object to yield
+            data_mod = '"{}" {} {} {}'.format(
+                feat.GetField('path'),
+                feat.GetField('format'),
+                feat.GetField('weight'),
+                feat.GetField('uncertainty')
+            )
+            data_set_args.update(mod=data_mod, metadata=md)
+            data_set = DatasetFactory(
+                **self._set_params(**data_set_args)
+            )._acquire_module()
+            if data_set is not None and data_set.valid_p(
+                    fmts=DatasetFactory._modules[data_set.data_format]['fmts']
+            ):
+                yield(data_set)
+            else:
+                yield(None)
+        
     def parse_no_json(self):
         """parse the datalist file.
 
@@ -5110,16 +5766,34 @@ class Datalist(ElevationDataset):
 
         status = 0
         if os.path.exists(self.fn):
-            with open(self.fn, 'r') as f:
-                count = sum(1 for _ in f)
+            ## the xy bounds of each entry are gathered on the first full parse of the datalist
+            ## into `self._sindex`; later parses test all the bounds against the region at once
+            ## and skip the entries that fall entirely outside of it without re-initializing them.
+            ## entries that are transformed, or have no valid inf region, are never skipped.
+            dl_mtime = os.stat(self.fn).st_mtime
+            skip_lines = set()
+            if self._sindex is not None and self._sindex[0] != dl_mtime:
+                self._sindex = None
+                
+            if self._sindex is not None and self.region is not None and self.region.valid_p(check_xy=True):
+                idx_lines, idx_bounds = self._sindex[1], self._sindex[2]
+                with np.errstate(invalid='ignore'):
+                    outside = (idx_bounds[:,0] > self.region.xmax) | (idx_bounds[:,1] < self.region.xmin) \
+                        | (idx_bounds[:,2] > self.region.ymax) | (idx_bounds[:,3] < self.region.ymin)
+                    
+                skip_lines = set(idx_lines[outside].tolist())
 
+            sindex = {} if self._sindex is None else None
             with open(self.fn, 'r') as op:
                 with tqdm(desc='parsing datalist {}...'.format(self.fn), leave=self.verbose) as pbar:
                     for l, this_line in enumerate(op):
                         pbar.update()
+                        if l in skip_lines:
+                            continue
+                        
                         ## parse the datalist entry line
                         if this_line[0] != '#' and this_line[0] != '\n' and this_line[0].rstrip() != '':
-                            md = copy.deepcopy(self.metadata)
+                            md = dict(self.metadata)
                             md['name'] = utils.fn_basename2(os.path.basename(self.fn))
                             
                             ## generate the dataset object to yield
@@ -5132,6 +5806,16 @@ class Datalist(ElevationDataset):
                                     fmts=DatasetFactory._modules[data_set.data_format]['fmts']
                             ):
                                 data_set.initialize()
+                                if sindex is not None:
+                                    sindex[l] = [np.nan] * 4
+                                    if data_set.transformer is None:
+                                        try:
+                                            inf_region = regions.Region().from_list(data_set.infos.minmax)
+                                            if inf_region.valid_p(check_xy=True):
+                                                sindex[l] = [inf_region.xmin, inf_region.xmax, inf_region.ymin, inf_region.ymax]
+                                        except:
+                                            pass
+                                    
                                 ## filter with input source region, if necessary
                                 ## check input source region against the dataset region found
                                 ## in its inf file.
@@ -5164,10 +5848,18 @@ class Datalist(ElevationDataset):
                                         self.data_entries.append(ds)
                                         yield(ds)
 
+            ## only keep the index of a complete parse
+            if sindex is not None:
+                self._sindex = (
+                    dl_mtime,
+                    np.array(list(sindex.keys()), dtype=np.int64),
+                    np.array(list(sindex.values()), dtype=np.float64).reshape(-1, 4)
+                )
+
         ## self.fn is not a file-name, so check if self.data_entries not empty
         ## and return the dataset objects found there.
         elif len(self.data_entries) > 0:
-            for data_set in self.data_entries:
+            for data_set in self.yield_entries():
                 for ds in data_set.parse():
                     yield(ds)
         else:
@@ -5266,18 +5958,9 @@ class ZIPlist(ElevationDataset):
             ):
                 data_set.initialize()
                 if self.region is not None and self.region.valid_p(check_xy=True):
-                    try:
-                        inf_region = regions.Region().from_string(
-                            data_set.infos.wkt
-                        )
-                    except:
-                        try:
-                            inf_region = regions.Region().from_list(
-                                data_set.infos.minmax
-                            )
-                        except:
-                            inf_region = self.region.copy()
-                            
+                    ## the cached inf region is shared, so copy it before setting the w/u ranges
+                    inf_region = data_set.inf_region()
+                    inf_region = self.region.copy() if inf_region is None else inf_region.copy()
                     inf_region.wmin = data_set.weight
                     inf_region.wmax = data_set.weight
                     inf_region.umin = data_set.uncertainty
@@ -5464,7 +6147,7 @@ class NEDFetcher(Fetcher):
             ned_mask = self.mask
         
         src_dem = os.path.join(self.fetch_module._outdir, result[1])
-        ned_metadata = copy.deepcopy(self.metadata)
+        ned_metadata = dict(self.metadata)
         ned_metadata['name'] = src_dem
         self.fetches_params['mod'] = src_dem
         self.fetches_params['mask'] = ned_mask
@@ -6218,8 +6901,8 @@ class NGSFetcher(Fetcher):
             self.datum = 'geoidHt'
 
     def set_ds(self, result):
-        with open(os.path.join(self.fetch_module._outdir, result[1]), 'r') as json_file:
-            r = json.load(json_file)
+        with open(os.path.join(self.fetch_module._outdir, result[1]), 'rb') as json_file:
+            r = orjson.loads(json_file.read()) if has_orjson else json.load(json_file)
             if len(r) > 0:
                 with open(os.path.join(self.fetch_module._outdir, '_tmp_ngs.xyz'), 'w') as tmp_ngs:
                     for row in r:
@@ -6250,8 +6933,8 @@ class TidesFetcher(Fetcher):
         self.units = units
         
     def set_ds(self, result):
-        with open(os.path.join(self.fetch_module._outdir, result[1]), 'r') as json_file:
-            r = json.load(json_file)
+        with open(os.path.join(self.fetch_module._outdir, result[1]), 'rb') as json_file:
+            r = orjson.loads(json_file.read()) if has_orjson else json.load(json_file)
             if len(r) > 0:
                 with open(os.path.join(self.fetch_module._outdir, '_tmp_tides.xyz'), 'w') as tmp_ngs:
                     for feature in r['features']:
@@ -6301,8 +6984,8 @@ class WaterServicesFetcher(Fetcher):
         self.site_code = site_code
         
     def set_ds(self, result):
-        with open(os.path.join(self.fetch_module._outdir, result[1]), 'r') as json_file:
-            r = json.load(json_file)
+        with open(os.path.join(self.fetch_module._outdir, result[1]), 'rb') as json_file:
+            r = orjson.loads(json_file.read()) if has_orjson else json.load(json_file)
             if len(r) > 0:
                 with open(os.path.join(self.fetch_module._outdir, '_tmp_ws.xyz'), 'w') as tmp_ws:
                     features = r['value']['timeSeries']
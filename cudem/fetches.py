@@ -293,12 +293,18 @@ class iso_xml:
 class Fetch:
     """Fetch class to fetch ftp/http data files"""
     
-    def __init__(self, url=None, callback=fetches_callback, verbose=None, headers=r_headers, verify=True):
+    def __init__(self, url=None, callback=fetches_callback, verbose=None, headers=r_headers, verify=True, session=None):
         self.url = url
         self.callback = callback
         self.verbose = verbose
         self.headers = headers
         self.verify = verify
+        self.session = session # an optional requests.Session to reuse connections
+
+    def _get(self, *args, **kwargs):
+        """requests.get through `self.session`, if set"""
+        
+        return((requests if self.session is None else self.session).get(*args, **kwargs))
 
     def fetch_req(self, params=None, tries=5, timeout=None, read_timeout=None):
         """fetch src_url and return the requests object"""
@@ -308,7 +314,7 @@ class Fetch:
             raise ConnectionError('Maximum attempts at connecting have failed.')
         
         try:
-            req = requests.get(
+            req = self._get(
                 self.url, stream=True, params=params, timeout=(timeout,read_timeout), headers=self.headers, verify=self.verify
             )
         except Exception as e:
@@ -408,7 +414,7 @@ class Fetch:
                     resume_byte_pos = dst_fn_size
                     self.headers['Range'] = 'bytes={}-'.format(resume_byte_pos)
 
-            with requests.get(self.url, stream=True, params=params, headers=self.headers,
+            with self._get(self.url, stream=True, params=params, headers=self.headers,
                               timeout=(timeout,read_timeout), verify=self.verify) as req:
 
                 ## requested range is not satisfiable, most likely the requested
@@ -451,7 +457,7 @@ class Fetch:
                         raise UnboundLocalError('Incorrect Authentication')
 
                     ## re-run the Fetch with the new URL
-                    status = Fetch(url=req.url, headers=self.headers, verbose=self.verbose).fetch_file(
+                    status = Fetch(url=req.url, headers=self.headers, verbose=self.verbose, session=self.session).fetch_file(
                         dst_fn,
                         params=params,
                         datatype=datatype,
@@ -29,6 +29,7 @@ import os
 import sys
 import shutil
 import math
+import functools
 from tqdm import tqdm
 from tqdm import trange
 
@@ -164,6 +165,7 @@ def osr_prj_file(dst_fn, src_srs):
     else:
         return(-1)
 
+@functools.lru_cache(maxsize=64)
 def epsg_from_input(in_srs):
     """get the epsg(s) from srs suitable as input to SetFromUserInput
 
@@ -1385,13 +1387,28 @@ def gdal_proximity(src_gdal, dst_gdal, band = 1, distunits='pixel'):
     with gdal_datasource(src_gdal) as src_ds:
         if src_ds is not None:
             ds_config = gdal_infos(src_ds)
-            mem_ds = gdal_mem_ds(ds_config, name = 'MEM', bands = 1, src_srs = None)
             src_band = src_ds.GetRasterBand(band)
-            src_arr = src_band.ReadAsArray()
-            src_arr[src_arr != ds_config['ndv']] = 1
-            src_arr[src_arr == ds_config['ndv']] = 0
+            ## the (0/1) data mask as bytes, wrapped by a MEM dataset (DATAPOINTER)
+            ## rather than copied into one; src_mask must outlive mem_ds.
+            src_mask = np.ascontiguousarray(src_band.ReadAsArray() != ds_config['ndv'], dtype=np.uint8)
+            mem_open = gdal.GetConfigOption('GDAL_MEM_ENABLE_OPEN')
+            gdal.SetConfigOption('GDAL_MEM_ENABLE_OPEN', 'YES')
+            mem_ds = gdal.Open(
+                'MEM:::DATAPOINTER={},PIXELS={},LINES={},BANDS=1,DATATYPE=Byte'.format(
+                    src_mask.ctypes.data, ds_config['nx'], ds_config['ny']
+                )
+            )
+            gdal.SetConfigOption('GDAL_MEM_ENABLE_OPEN', mem_open)
+
+            if mem_ds is not None:
+                mem_ds.SetGeoTransform(ds_config['geoT'])
+                if ds_config['proj'] is not None:
+                    mem_ds.SetProjection(ds_config['proj'])
+            else:
+                mem_ds = gdal_mem_ds(ds_config, name = 'MEM', bands = 1, src_srs = None)
+                mem_ds.GetRasterBand(1).WriteArray(src_mask)
+                
             mem_band = mem_ds.GetRasterBand(1)
-            mem_band.WriteArray(src_arr)
 
     drv = gdal.GetDriverByName('GTiff')
     dst_ds = drv.Create(dst_gdal, ds_config['nx'], ds_config['ny'], 1, gdal.GDT_Int32 if distunits == 'PIXEL' else gdal.GDT_Float32, [])
@@ -1727,47 +1744,100 @@ def gdal_parse(src_ds, dump_nodata = False, srcwin = None, mask = None, dst_srs
     if srcwin is None:
         srcwin = (0, 0, ds_config['nx'], ds_config['ny'])
         
-    nodata = ['{:g}'.format(-9999), 'nan', float('nan')]
-    if band.GetNoDataValue() is not None:
-        nodata.append('{:g}'.format(band.GetNoDataValue()))
-        
-    if dump_nodata:
-        nodata = []
-        
-    for y in range(srcwin[1], srcwin[1] + srcwin[3], 1):
-        band_data = band.ReadAsArray(srcwin[0], y, srcwin[2], 1)
+    ## read the srcwin in strips of whole blocks (at least 256 rows, at most
+    ## ~4M pixels) and mask out the nodata, z_region and mask pixels of each
+    ## strip at once, rather than reading and testing each row/pixel value
+    ndv = band.GetNoDataValue()
+    block_ysize = max(band.GetBlockSize()[1], 256)
+    block_ysize = max(1, min(block_ysize, 4194304 // max(srcwin[2], 1)))
+    ## the first strip's arrays are re-used as the read buffers of the following
+    ## (same or shorter) strips, so each strip doesn't allocate new arrays
+    band_buf = msk_buf = None
+    for y0 in range(srcwin[1], srcwin[1] + srcwin[3], block_ysize):
+        y_size = min(block_ysize, srcwin[1] + srcwin[3] - y0)
+        if band_buf is None:
+            band_data = band_buf = band.ReadAsArray(srcwin[0], y0, srcwin[2], y_size)
+        else:
+            band_data = band.ReadAsArray(srcwin[0], y0, srcwin[2], y_size, buf_obj=band_buf[:y_size])
+            
+        valid = np.ones(band_data.shape, dtype=bool)
         if z_region is not None:
             if z_region[0] is not None:
-                band_data[band_data < z_region[0]] = -9999
+                valid &= ~(band_data < z_region[0])
                 
             if z_region[1] is not None:
-                band_data[band_data > z_region[1]] = -9999
+                valid &= ~(band_data > z_region[1])
                 
         if msk_band is not None:
-            msk_data = msk_band.ReadAsArray(srcwin[0], y, srcwin[2], 1)
-            band_data[msk_data==0]=-9999
+            if msk_buf is None:
+                msk_data = msk_buf = msk_band.ReadAsArray(srcwin[0], y0, srcwin[2], y_size)
+            else:
+                msk_data = msk_band.ReadAsArray(srcwin[0], y0, srcwin[2], y_size, buf_obj=msk_buf[:y_size])
+                
+            valid &= msk_data != 0
+
+        if dump_nodata:
+            band_data[~valid] = -9999
+            valid[:] = True
+        else:
+            valid &= ~np.isnan(band_data) & (band_data != -9999)
+            if ndv is not None:
+                valid &= band_data != ndv
+
+        y_idx, x_idx = np.nonzero(valid)
+        ln += len(x_idx)
+        geo_xs, geo_ys = utils._pixel2geo(x_idx + srcwin[0], y_idx + y0, gt)
+        for geo_x, geo_y, z in zip(geo_xs, geo_ys, band_data[y_idx, x_idx]):
+            xyz = xyzfun.XYZPoint(x=geo_x, y=geo_y, z=z)
+            yield(xyz)
             
-        band_data = np.reshape(band_data, (srcwin[2], ))
-        for x_i in range(0, srcwin[2], 1):
-            x = x_i + srcwin[0]
-            z = band_data[x_i]
-            if '{:g}'.format(z) not in nodata:
-                ln += 1
-                geo_x,geo_y = utils._pixel2geo(x, y, gt)
-                # if warp is not None:
-                #     #point = xyzfun.XYZPoint(x=geo_x, y=geo_y, z=z, epsg=4326)
-                #     point = ogr.CreateGeometryFromWkt('POINT ({} {})'.format(geo_x, geo_y))
-                #     point.Transform(dst_trans)
-                #     pnt = point.GetPoint()
-                #     xyz = xyzfun.XYZPoint(x=point.GetX(), y=point.GetY(), z=z)#from_list([pnt[0], pnt[1], z])
-                # else:
-                xyz = xyzfun.XYZPoint(x=geo_x, y=geo_y, z=z)#line = [geo_x, geo_y, z]
-                yield(xyz)
     band = None
     src_mask = None
     msk_band = None
     if verbose: utils.echo_msg('parsed {} data records from {}'.format(ln, src_ds.GetDescription()))
     
+def gdal_read_pixels(src_band, xpos, ypos):
+    """read the values of `src_band` at the pixel arrays `xpos`, `ypos`
+
+    the pixels are grouped by the band's block size and only the blocks
+    that contain pixels are read, so memory is bounded by a block rather
+    than the whole raster. pixels are assumed to be within the band.
+
+    Args:
+      src_band (gdal.Band): the gdal raster band to read from
+      xpos (array): the pixel x (column) positions
+      ypos (array): the pixel y (row) positions
+
+    Returns:
+      array: the band values at each pixel
+    """
+
+    block_xsize, block_ysize = src_band.GetBlockSize()
+    ## scan-line (or small) blocks, read windows of at least 256 rows/columns
+    block_xsize = max(block_xsize, 256)
+    block_ysize = max(block_ysize, 256)
+    block_x = xpos // block_xsize
+    block_y = ypos // block_ysize
+    n_block_x = (src_band.XSize + block_xsize - 1) // block_xsize
+    block_idx = block_y * n_block_x + block_x
+    
+    out_vals = np.empty(len(xpos), dtype=np.float64)
+    order = np.argsort(block_idx, kind='stable')
+    blocks, starts = np.unique(block_idx[order], return_index=True)
+    ends = np.append(starts[1:], len(order))
+    for block, start, end in zip(blocks, starts, ends):
+        this_idx = order[start:end]
+        x_off = int(block % n_block_x) * block_xsize
+        y_off = int(block // n_block_x) * block_ysize
+        block_data = src_band.ReadAsArray(
+            x_off, y_off,
+            min(block_xsize, src_band.XSize - x_off),
+            min(block_ysize, src_band.YSize - y_off)
+        )
+        out_vals[this_idx] = block_data[ypos[this_idx] - y_off, xpos[this_idx] - x_off]
+
+    return(out_vals)
+    
 def gdal_yield_query(src_xyz, src_gdal, out_form, band = 1):
     """query a gdal-compatible grid file with xyz data.
     out_form dictates return values
@@ -1799,9 +1869,10 @@ def gdal_yield_query(src_xyz, src_gdal, out_form, band = 1):
 
             if x > ds_gt[0] and y < float(ds_gt[3]):
                 xpos, ypos = utils._geo2pixel(x, y, ds_gt, node='pixel')
-                try: 
+                if 0 <= xpos < ds_config['nx'] and 0 <= ypos < ds_config['ny']:
                     g = tgrid[ypos, xpos]
-                except: g = ds_nd
+                else:
+                    g = ds_nd
                 d = c = m = s = ds_nd
                 if g != ds_nd:
                     d = z - g
@@ -576,8 +576,7 @@ class InterpolationUncertainty: #(waffles.Waffle):
                 if s_dp is not None and len(s_dp) > 0:
                     d_max = self.region_info[self.dem.name][4]
                     #s_max = self.region_info[self.dem.name][5]
-                    s_dp = s_dp[s_dp[:,3] < max_dist,:]
-                    s_dp = s_dp[s_dp[:,3] >= 1,:]
+                    s_dp = s_dp[(s_dp[:,3] < max_dist) & (s_dp[:,3] >= 1),:]
                     prox_err = s_dp[:,[2,3]]
 
                     if last_ec_d is None:
@@ -533,7 +533,7 @@ def _geo2pixel(geo_x, geo_y, geo_transform, node='grid'):
             pixel_x += .5
             pixel_y += .5
     else:
-        pixel_x, pixel_y = _apply_gt(geo_x, geo_y, _invert_gt(geo_transform))
+        pixel_x, pixel_y = _apply_gt(geo_x, geo_y, _invert_gt(geo_transform), node='grid')
         
     return(int(pixel_x), int(pixel_y))
 
@@ -615,6 +615,18 @@ def _invert_gt(geo_transform):
     Returns:
       list: a geo-transform list describing a raster
     """
+
+    ## use gdal's C implementation when available; older gdal
+    ## bindings return a (success, inverted-geotransform) tuple
+    try:
+        from osgeo import gdal
+        inv_gt = gdal.InvGeoTransform(geo_transform)
+        if inv_gt is not None and len(inv_gt) == 2:
+            inv_gt = inv_gt[1] if inv_gt[0] else None
+
+        return(list(inv_gt) if inv_gt is not None else None)
+    except (ImportError, TypeError, ValueError):
+        pass
     
     det = (geo_transform[1]*geo_transform[5]) - (geo_transform[2]*geo_transform[4])
     if abs(det) < 0.000000000000001: return
@@ -624,10 +636,10 @@ def _invert_gt(geo_transform):
     out_geo_transform[1] = geo_transform[5] * inv_det
     out_geo_transform[4] = -geo_transform[4] * inv_det
     out_geo_transform[2] = -geo_transform[2] * inv_det
-    out_geo_transfrom[5] = geo_transform[1] * inv_Det
+    out_geo_transform[5] = geo_transform[1] * inv_det
     out_geo_transform[0] = (geo_transform[2] * geo_transform[3] - geo_transform[0] * geo_transform[5]) * inv_det
-    out_geo_Transform[3] = (-geo_transform[1] * geo_transform[3] + geo_transform[0] * geo_transform[4]) * inv_det
-    return(outGeoTransform)
+    out_geo_transform[3] = (-geo_transform[1] * geo_transform[3] + geo_transform[0] * geo_transform[4]) * inv_det
+    return(out_geo_transform)
 
 def x360(x):
     if x == 0:
@@ -970,6 +982,77 @@ def buffer_srcwin(srcwin=(), n_size=None, buff_size=0, verbose=True):
     
     return(int(x_origin), int(y_origin), int(x_size), int(y_size))
 
+## ==============================================
+##
+## threaded read-ahead
+##
+## yield_from_thread - yield the items of a generator
+## that is run in a background thread
+##
+## ==============================================
+def yield_from_thread(producer, maxsize=2):
+    """Yield the items of `producer()`, read ahead in a background thread.
+
+    Up to `maxsize` items are read ahead while the current item is being
+    used. An exception raised by the producer is raised again here. When
+    the consumer stops early (or fails), the producer is stopped and its
+    thread is joined before returning.
+
+    Args:
+      producer (func): a function returning an iterable, called in the thread
+      maxsize (int): the maximum number of items to read ahead
+
+    Yields:
+      the items of `producer()`, in order
+    """
+
+    item_q = queue.Queue(maxsize=maxsize)
+    stop_event = threading.Event()
+
+    def _put(item):
+        ## don't block forever on a full queue once the consumer has stopped
+        while not stop_event.is_set():
+            try:
+                item_q.put(item, timeout=1)
+                return(True)
+            except queue.Full:
+                continue
+
+        return(False)
+
+    def _produce():
+        items = None
+        try:
+            items = producer()
+            for item in items:
+                if not _put((item, None)):
+                    return
+
+        except Exception as e:
+            _put((None, e))
+            return
+
+        finally:
+            ## close a generator producer here, in its own thread
+            if hasattr(items, 'close'):
+                items.close()
+
+        _put(None)
+
+    t = threading.Thread(target=_produce)
+    t.daemon = True
+    t.start()
+    try:
+        for item, e in iter(item_q.get, None):
+            if e is not None:
+                raise e
+
+            yield(item)
+
+    finally:
+        stop_event.set()
+        t.join()
+
 ## ==============================================
 ##
 ## MB-System functions
@@ -342,15 +342,16 @@ class Waffle:
         """dump the stacked xyz data to dst_port
 
         use this to dump data into a foreign cli program, such as GMT.
+        the data are dumped in batches of arrays, rather than point-by-point.
         """
 
-        for xyz in self.stack_ds.yield_xyz():
-            xyz.dump(
-                include_w = self.want_weight,
-                include_u = self.want_uncertainty,
-                dst_port=dst_port,
-                encode=encode,
-            )
+        self.stack_ds.dump_xyz_direct(
+            dst_port=dst_port,
+            encode=encode,
+            include_w=bool(self.want_weight),
+            include_u=bool(self.want_uncertainty),
+            precision=6
+        )
     
     def generate(self):
         """run and process the WAFFLES module.
@@ -691,9 +692,8 @@ def flatten_no_data_zones(src_dem, dst_dem = None, band = 1, size_threshold = 1,
         src_config = gdalfun.gdal_infos(src_ds)
         src_arr[src_arr == src_config['ndv']] = np.nan
 
-        ## generate the mask array
-        msk_arr = np.zeros((src_config['ny'], src_config['nx']))
-        msk_arr[np.isnan(src_arr)] = 1
+        ## generate the (0/1) mask array
+        msk_arr = np.isnan(src_arr).astype(np.uint8)
         
         ## group adjacent non-zero cells
         l, n = scipy.ndimage.label(msk_arr)
@@ -902,6 +902,10 @@ class WafflesIDW(Waffle):
         if self.chunk_size is None:
             n_chunk = int(self.ds_config['nx'] * .1)
             n_chunk = 10 if n_chunk < 10 else n_chunk
+            ## the output is tiled in 256x256 blocks, align larger default chunks
+            ## (and their half-chunk steps) to the blocks
+            if n_chunk > 256:
+                n_chunk = int(math.ceil(n_chunk / 256) * 256)
         else:
             n_chunk = self.chunk_size
             
@@ -1209,6 +1213,10 @@ class WafflesSciPy(Waffle):
         if self.chunk_size is None:
             n_chunk = int(self.ds_config['nx'] * .1)
             n_chunk = 10 if n_chunk < 10 else n_chunk
+            ## the output is tiled in 256x256 blocks, align larger default chunks
+            ## (and their half-chunk steps) to the blocks
+            if n_chunk > 256:
+                n_chunk = int(math.ceil(n_chunk / 256) * 256)
         else:
             n_chunk = self.chunk_size
             
@@ -1703,7 +1711,11 @@ class WafflesGDALGrid(Waffle):
             fd.SetPrecision(8)
             layer.CreateField(fd)
             
-        f = ogr.Feature(feature_def=layer.GetLayerDefn())        
+        ## re-use a single feature and point geometry, setting the point
+        ## coordinates directly rather than building and parsing a wkt per point
+        f = ogr.Feature(feature_def=layer.GetLayerDefn())
+        g = ogr.Geometry(ogr.wkbPoint25D)
+        layer.StartTransaction()
         with tqdm(desc='vectorizing stack', leave=self.verbose) as pbar:
             for this_xyz in self.stack_ds.yield_xyz():
                 pbar.update()
@@ -1713,11 +1725,11 @@ class WafflesGDALGrid(Waffle):
                 if self.want_weight:
                     f.SetField(3, this_xyz.w)
 
-                wkt = this_xyz.export_as_wkt(include_z=True)
-                g = ogr.CreateGeometryFromWkt(wkt)
-                f.SetGeometryDirectly(g)
+                g.SetPoint(0, this_xyz.x, this_xyz.y, float(this_xyz.z))
+                f.SetGeometry(g)
                 layer.CreateFeature(f)
-            
+
+        layer.CommitTransaction()
         return(ogr_ds)
         
     def run(self):
@@ -1885,10 +1897,13 @@ class WafflesNum(Waffle):
                 )
             )          
             
+        ## the grid is written as Float32, so accumulate the sums as float32;
+        ## each chunk is reduced in float64 first, which bounds the rounding error
+        ## to the number of chunks that touch a cell rather than the number of points.
         if self.mode == 'm' or self.mode == 'w':
-            sum_array = np.zeros((ycount, xcount))
+            sum_array = np.zeros((ycount, xcount), dtype=np.float32)
             
-        count_array = np.zeros((ycount, xcount))
+        count_array = np.zeros((ycount, xcount), dtype=np.int32)
         gdt = gdal.GDT_Float32
         ds_config = gdalfun.gdal_set_infos(
             xcount,
@@ -1903,33 +1918,39 @@ class WafflesNum(Waffle):
             None
         )
         
-        for this_xyz in self.yield_xyz():
-            if regions.xyz_in_region_p(this_xyz, self.p_region):
-                xpos, ypos = utils._geo2pixel(
-                    this_xyz.x, this_xyz.y, dst_gt, 'pixel'
-                )
+        ## accumulate the points per chunk: sort the flat cell indices of the points
+        ## and reduce each group of touched cells, rather than scattering point by point
+        for points in self.stack_ds.yield_points():
+            pixel_x = np.floor((points['x'] - dst_gt[0]) / dst_gt[1]).astype(int)
+            pixel_y = np.floor((points['y'] - dst_gt[3]) / dst_gt[5]).astype(int)
+            in_grid = (pixel_x >= 0) & (pixel_x < xcount) & (pixel_y >= 0) & (pixel_y < ycount)
+            if not np.any(in_grid):
+                continue
+
+            flat = pixel_y[in_grid] * xcount + pixel_x[in_grid]
+            order = np.argsort(flat, kind='stable')
+            cells, starts, counts = np.unique(flat[order], return_index=True, return_counts=True)
+            if self.mode == 'm' or self.mode == 'w':
+                z_s = np.array(points['z'], dtype=np.float64)[in_grid][order]
+                sum_array.ravel()[cells] += np.add.reduceat(z_s, starts).astype(np.float32)
                 
-                try:
-                    if self.mode == 'm' or self.mode == 'w':
-                        sum_array[ypos, xpos] += this_xyz.z
-                    if self.mode == 'n' or self.mode == 'm' or self.mode == 'w':
-                        count_array[ypos, xpos] += 1
-                    else:
-                        count_array[ypos, xpos] = 1
-                        
-                except Exception as e:
-                    pass
+            if self.mode == 'n' or self.mode == 'm' or self.mode == 'w':
+                count_array.ravel()[cells] += counts.astype(np.int32)
+            else:
+                count_array.ravel()[cells] = 1
                 
+        ## divide only where data exists, empty cells are set to ndv
+        valid = count_array > 0
         if self.mode == 'm' or self.mode == 'w':
-            count_array[count_array == 0] = np.nan
-            out_array = (sum_array/count_array)
+            out_array = sum_array
+            out_array[valid] /= count_array[valid]
             if self.mode == 'w':
-                out_array[out_array >= 0] = 1
-                out_array[out_array < 0] = 0
+                out_array[valid] = out_array[valid] >= 0
+                
+            out_array[~valid] = self.ndv
         else:
-            out_array = count_array
+            out_array = count_array.astype(np.float32)
 
-        out_array[np.isnan(out_array)] = self.ndv            
         gdalfun.gdal_write(out_array, self.fn, ds_config)
         
     def run(self):
@@ -4044,17 +4065,14 @@ class WafflesCUBE(Waffle):
         if self.verbose:
             utils.echo_msg('buffering srcwin by {} pixels'.format(self.chunk_buffer))
 
-        _x, _y = np.mgrid[0:ds_config['nx'], 0:ds_config['ny']]
-        _x = _x.ravel()
-        _y = _y.ravel()
-
+        ## only compute the pixel x/y of the cells with data, rather than
+        ## building (and indexing) a full nx*ny mgrid of them
         _z = points_band.ReadAsArray()
         _z = _z.T
         _z = _z.ravel()
-        point_indices = np.nonzero(_z != ds_config['ndv'])
+        point_indices = np.flatnonzero(_z != ds_config['ndv'])
         point_values = _z[point_indices]        
-        xi = _x[point_indices]
-        yi = _y[point_indices]
+        xi, yi = np.divmod(point_indices, ds_config['ny'])
 
         thu = np.ones(len(point_values))
         thu[:] = 2
@@ -4090,7 +4108,7 @@ class WafflesCUBE(Waffle):
         res_x, res_y = ds_config['geoT'][1], ds_config['geoT'][5]*-1
         depth_grid, uncertainty_grid, ratio_grid, numhyp_grid = cube.run_cube_gridding(
             point_values, thu, tvu, xi, yi, self.ds_config['nx'], self.ds_config['ny'],
-            min(_x), max(_y), 'local', 'order1a', 1, 1)
+            0, ds_config['ny'] - 1, 'local', 'order1a', 1, 1)
         print(depth_grid)
         depth_grid = np.flip(depth_grid)
         depth_grid = np.fliplr(depth_grid)
@@ -4318,6 +4336,7 @@ class WafflesPatch(Waffle):
     
     dem=[path] - the path the the DEM to update
     min_weight=[val] - the minumum data weight to include in the patched DEM
+    gmt_blockmedian=[True/False] - block the differences with `gmt blockmedian` rather than in-process
     """
     
     def __init__(
@@ -4326,6 +4345,7 @@ class WafflesPatch(Waffle):
             min_weight=1,
             max_diff=.25,
             dem=None,
+            gmt_blockmedian=False,
             **kwargs
     ):
         super().__init__(**kwargs)
@@ -4333,6 +4353,7 @@ class WafflesPatch(Waffle):
         self.min_weight = utils.float_or(min_weight)
         self.max_diff = utils.float_or(max_diff)
         self.dem = dem
+        self.gmt_blockmedian = gmt_blockmedian
 
     def yield_diff(self, src_dem, max_diff=.25):
         '''query a gdal-compatible grid file with xyz data.
@@ -4363,10 +4384,11 @@ class WafflesPatch(Waffle):
 
             for xyz in self.yield_xyz():
                 #if xyz.x > ds_gt[0] and xyz.y < float(ds_gt[3]):
-                try: 
-                    xpos, ypos = utils._geo2pixel(xyz.x, xyz.y, ds_gt, 'pixel')
+                xpos, ypos = utils._geo2pixel(xyz.x, xyz.y, ds_gt, 'pixel')
+                if 0 <= xpos < ds_config['nx'] and 0 <= ypos < ds_config['ny']:
                     g = tgrid[ypos, xpos]
-                except: g = ds_nd
+                else:
+                    g = ds_nd
                 
                 if g != ds_nd:
                     d = xyz.z - g
@@ -4378,7 +4400,11 @@ class WafflesPatch(Waffle):
             ds = None
         
     def query_dump(self, dst_port=sys.stdout, encode=False,  max_diff=.25, **kwargs):
-        for xyz in self.yield_diff(self.dem, max_diff):
+        diffs = self.yield_diff(self.dem, max_diff)
+        if not self.gmt_blockmedian:
+            diffs = xyzfun.xyz_block_median(diffs, self.region, self.xinc, self.yinc)
+            
+        for xyz in diffs:
             xyz.dump(
                 include_w = self.want_weight,
                 include_u = self.want_uncertainty,
@@ -4412,8 +4438,11 @@ class WafflesPatch(Waffle):
         # diff_cmd = 'gmt blockmedian {region} -I{xinc}/{yinc} | gmt surface {region} -I{xinc}/{yinc} -G_diff.tif=gd+n-9999:GTiff -T.1 -Z1.2 -V -rp -C.5 -Lud -Lld -M{radius}'.format(
         #     region=dem_region, xinc=dem_infos['geoT'][1], yinc=-1*dem_infos['geoT'][5], radius=self.radius
         # )
-        diff_cmd = 'gmt blockmedian {region} -I{xinc}/{yinc} | gmt surface {region} -I{xinc}/{yinc} -G_diff.tif=gd+n{ndv}:GTiff -T.1 -Z1.2 -V -Lud -Lld'.format(
-            region=self.region.format('gmt'), xinc=self.xinc, yinc=self.yinc, ndv=self.ndv, radius=self.radius
+        diff_cmd = '{blockmedian}gmt surface {region} -I{xinc}/{yinc} -G_diff.tif=gd+n{ndv}:GTiff -T.1 -Z1.2 -V -Lud -Lld'.format(
+            region=self.region.format('gmt'), xinc=self.xinc, yinc=self.yinc, ndv=self.ndv, radius=self.radius,
+            blockmedian='gmt blockmedian {region} -I{xinc}/{yinc} | '.format(
+                region=self.region.format('gmt'), xinc=self.xinc, yinc=self.yinc
+            ) if self.gmt_blockmedian else ''
         )
 
         out, status = utils.run_cmd(
@@ -4685,9 +4714,8 @@ def nodata_count_mask(src_dem, band = 1):
             src_config = gdalfun.gdal_infos(src_ds)
             src_arr[src_arr == src_config['ndv']] = np.nan
 
-            ## generate the mask array
-            msk_arr = np.zeros((src_config['ny'], src_config['nx']))
-            msk_arr[np.isnan(src_arr)] = 1
+            ## generate the (0/1) mask array
+            msk_arr = np.isnan(src_arr).astype(np.uint8)
 
             ## group adjacent non-zero cells
             l, n = scipy.ndimage.label(msk_arr)
@@ -26,11 +26,16 @@
 ### Code:
 
 import sys
+import numpy as np
 from cudem.utils import float_or
 from cudem.utils import str_or
 
 class XYZPoint:
     """represnting an xyz data point"""
+
+    ## a point is created for every yielded xyz record, slots make them
+    ## smaller and faster to create and access than a per-instance __dict__
+    __slots__ = ('x', 'y', 'z', 'w', 'u', 'src_srs', 'z_units', 'z_datum')
     
     def __init__(self, x = None, y = None, z = None, w = 1, u = 0,
                  src_srs='epsg:4326', z_units = 'm', z_datum = 'msl'):
@@ -431,11 +436,10 @@ def xyz_block(src_xyz, region, inc, weights = False, verbose = False):
         if x > region[0] and x < region[1]:
             if y > region[2] and y < region[3]:
                 xpos, ypos = utils._geo2pixel(x, y, dst_gt)
-                try:
+                if 0 <= xpos < xcount and 0 <= ypos < ycount:
                     sumArray[ypos, xpos] += z
                     ptArray[ypos, xpos] += 1
                     if weights: wtArray[ypos, xpos] += this_xyz[3]
-                except: pass
     ptArray[ptArray == 0] = np.nan
     if weights:
         wtArray[wtArray == 0] = 1
@@ -447,13 +451,52 @@ def xyz_block(src_xyz, region, inc, weights = False, verbose = False):
 
     outarray[np.isnan(outarray)] = -9999
     
-    for y in range(0, ycount):
-        for x in range(0, xcount):
-            geo_x, geo_y = utils._pixel2geo(x, y, dst_gt)
-            z = outarray[y,x]
-            if z != -9999:
-                yield([geo_x, geo_y, z])
+    ys, xs = np.nonzero(outarray != -9999)
+    geo_xs, geo_ys = utils._pixel2geo(xs, ys, dst_gt)
+    for geo_x, geo_y, z in zip(geo_xs, geo_ys, outarray[ys, xs]):
+        yield([geo_x, geo_y, z])
+
+def _group_medians(keys, vals, starts, counts):
+    """median of `vals` for each sorted group of `keys` starting at `starts`"""
+    
+    vals_s = vals[np.lexsort((vals, keys))]
+    return((vals_s[starts + (counts - 1) // 2] + vals_s[starts + counts // 2]) * .5)
+
+def xyz_block_median(src_xyz, region, x_inc, y_inc = None):
+    """block the src_xyz data to the median block value
+
+    this is an in-process replacement for piping the data through
+    `gmt blockmedian`; each block with data reports the median x, y and z
+    of the points that fall within it.
 
+    Args:
+      src_xyz (generataor): list/generator of XYZPoints
+      region (Region): the blocking region
+      x_inc (float): x blocking increment, in native units
+      y_inc (float): y blocking increment, in native units
+
+    Yields:
+      XYZPoint: the median xyz point of each block with data
+    """
+
+    xcount, ycount, dst_gt = region.geo_transform(x_inc=x_inc, y_inc=y_inc, node='grid')
+    xyz = np.array([[p.x, p.y, p.z] for p in src_xyz], dtype=float).reshape(-1, 3)
+    pixel_x = np.floor((xyz[:,0] - dst_gt[0]) / dst_gt[1]).astype(int)
+    pixel_y = np.floor((xyz[:,1] - dst_gt[3]) / dst_gt[5]).astype(int)
+    in_grid = (pixel_x >= 0) & (pixel_x < xcount) & (pixel_y >= 0) & (pixel_y < ycount)
+    if not np.any(in_grid):
+        return
+
+    xyz = xyz[in_grid]
+    flat = pixel_y[in_grid] * xcount + pixel_x[in_grid]
+    flat_s = np.sort(flat, kind='stable')
+    cells, starts, counts = np.unique(flat_s, return_index=True, return_counts=True)
+    med_x = _group_medians(flat, xyz[:,0], starts, counts)
+    med_y = _group_medians(flat, xyz[:,1], starts, counts)
+    med_z = _group_medians(flat, xyz[:,2], starts, counts)
+    for x, y, z in zip(med_x, med_y, med_z):
+        yield(XYZPoint(x=x, y=y, z=z))
+        
 def xyz_block_t(src_xyz, src_region, inc, verbose=False):
     """block the src_xyz data to the mean block value
 
@@ -483,7 +526,7 @@ def xyz_block_t(src_xyz, src_region, inc, verbose=False):
             if y > src_region[2] and y < src_region[3]:
             
                 xpos, ypos = utils._geo2pixel(x, y, dst_gt)
-                if xpos < xcount and ypos < ycount:
+                if 0 <= xpos < xcount and 0 <= ypos < ycount:
                     xyzArray.append(this_xyz)
                     blkArray[ypos,xpos].append(it)
                     it+=1            